@@ -5,10 +5,20 @@ Discord bot instance creation and configuration
 Creates and configures the Discord bot with all necessary intents and settings.
 """
 
+import aiohttp
 import discord
 from discord.ext import commands
 from config import COMMAND_PREFIX, GUILD_ID
 
+class ClankerBot(commands.Bot):
+    """Bot whose REST session keeps connections alive between animation edits."""
+
+    async def login(self, token: str) -> None:
+        # aiohttp's default keep-alive is 15s; the connector needs a running loop,
+        # so it is built here (just before the session opens) rather than at import
+        self.http.connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+        await super().login(token)
+
 def create_bot() -> commands.Bot:
     """
     Create and configure the Discord bot instance.
@@ -20,7 +30,7 @@ def create_bot() -> commands.Bot:
     intents = discord.Intents.all()
     
     # Create bot instance
-    bot = commands.Bot(
+    bot = ClankerBot(
         command_prefix=COMMAND_PREFIX,
         intents=intents,
         help_command=None  # We'll use a custom help command
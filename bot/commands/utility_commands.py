@@ -12,10 +12,12 @@ from typing import Optional
 import subprocess
 import os
 import tempfile
+import bisect
+import heapq
 
 from config import GUILD_ID, AUTO_SAVE_INTERVAL_MINUTES, QB_HOST, QB_USER, QB_PASS, DOWNLOAD_PATH, NOTIFY_USER_ID
 
-from services.plex_service import PlexService
+from services.plex_service import PlexService, PlexTitleIndex
 # Import qBittorrent for fetch and status commands
 try:
     import qbittorrentapi
@@ -28,18 +30,37 @@ from models.movie_state import MovieState
 from models.horror_bingo import HorrorBingoSystem, BingoView
 from models.hit_list import HitListSystem
 
+# Average-rating cut points and the emoji for each band (bisect_right keeps ">= cut" semantics)
+_RATING_CUTS = (3, 5, 7, 9)
+_RATING_EMOJIS = ("💀", "😐", "😊", "🔥", "👑")
+
+# Row templates parsed once at import and applied with format_map
+_RATING_ROW = "{emoji} **{title}** - {score}/10".format_map
+_HITLIST_ROW = "• **{movie}**".format_map
+_HITLIST_ROW_SHARED = "• **{movie}** _(+{others} others interested)_".format_map
+
+
+def _opt_field(embed: discord.Embed, name: str, value: Optional[str], inline: bool = True):
+    """Add an embed field only when it has a value."""
+    if value:
+        embed.add_field(name=name, value=value, inline=inline)
+
 
 class UtilityCommands(commands.Cog):
     """Cog containing utility and help commands."""
     
-    def __init__(self, bot: commands.Bot, plex_service: PlexService, ai_service: AIService, movie_state: MovieState, badge_system=None):
+    def __init__(self, bot: commands.Bot, plex_service: PlexService, ai_service: AIService, movie_state: MovieState, badge_system=None, title_index: Optional[PlexTitleIndex] = None):
         self.bot = bot
         self.plex_service = plex_service
         self.ai_service = ai_service
         self.movie_state = movie_state
+        self.title_index = title_index or PlexTitleIndex(plex_service)
         self.horror_bingo = HorrorBingoSystem(ai_service, badge_system)
         self.hit_list = HitListSystem()
         
+        # Resolve the watch badge system once instead of probing movie_state per command
+        self._badge_system = getattr(movie_state, 'badge_system', None) or None
+        
         # Initialize qBittorrent client
         self.qb = None
         if QB_AVAILABLE:
@@ -50,6 +71,12 @@ class UtilityCommands(commands.Cog):
                 print(f"qBittorrent connection failed: {e}")
                 pass  # qBittorrent not available
 
+    def _display_name(self, user_id: int) -> str:
+        """Resolve a user's display name from the bot's user cache."""
+        # get_user is a dict lookup and always reflects renames, so no extra memo
+        user = self.bot.get_user(user_id)
+        return user.display_name if user else f"User {user_id}"
+
     @commands.command(name="fetch")
     async def fetch_magnet(self, ctx: commands.Context, *, magnet_link: str):
         """Add a magnet link to qBittorrent for downloading."""
@@ -292,8 +319,8 @@ class UtilityCommands(commands.Cog):
                 # Wait a moment then get updated movie count
                 await ctx.send("📚 Library refresh initiated. Fetching updated horror movies...")
                 
-                # Get fresh horror movie list
-                horror_movies = await self.plex_service.get_horror_movies()
+                # Get fresh horror movie list (also updates the shared title index)
+                horror_movies = await self.title_index.refresh(force=True)
                 
                 embed = discord.Embed(
                     title="✅ Library Refreshed",
@@ -342,7 +369,7 @@ class UtilityCommands(commands.Cog):
             else:
                 # Fall back to a random horror movie from the library
                 try:
-                    horror_movies = await self.plex_service.get_horror_movies()
+                    horror_movies = (await self.title_index.ensure_fresh()).titles
                     if horror_movies:
                         import random
                         next_movie = random.choice(horror_movies)  # horror_movies already contains strings
@@ -809,11 +836,11 @@ Esc::ExitApp
     async def movie_history(self, ctx: commands.Context, *, user_mention: str = None):
         """Show movie watch history for bot or specific user."""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - movie history not tracked.")
             return
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         
         if user_mention:
             # Parse user mention or username
@@ -939,11 +966,11 @@ Esc::ExitApp
     async def movie_statistics(self, ctx: commands.Context):
         """Show comprehensive movie statistics."""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - movie statistics not tracked.")
             return
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         
         if not badge_system.watch_history:
             await ctx.send("📊 No movie data available yet.")
@@ -1069,11 +1096,11 @@ Esc::ExitApp
     async def top_watchers(self, ctx: commands.Context):
         """Show leaderboard of top movie watchers."""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - watcher data not tracked.")
             return
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         
         if not badge_system.user_stats:
             await ctx.send("👥 No watcher data available yet.")
@@ -1177,7 +1204,7 @@ Esc::ExitApp
                     movie_duration_ms = session_info.get('duration_ms') if session_info else None
                     join_position_ms = session_info.get('current_position_ms') if session_info else None
                     
-                    self.movie_state.badge_system.start_watching(
+                    self._badge_system.start_watching(
                         user_id=member.id,
                         username=member.display_name,
                         movie_title=movie_title,
@@ -1228,7 +1255,7 @@ Esc::ExitApp
     async def show_active_watches(self, ctx: commands.Context):
         """Show current active watch sessions in memory."""
         
-        active_watches = self.movie_state.badge_system.active_watches
+        active_watches = self._badge_system.active_watches
         
         if not active_watches:
             embed = discord.Embed(
@@ -1336,7 +1363,7 @@ Esc::ExitApp
     async def rate_movie(self, ctx: commands.Context, rating: int, *, movie_title: str):
         """Rate a movie from 1-10 stars. Usage: !rate 8 The Shining"""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - ratings not supported.")
             return
         
@@ -1345,7 +1372,7 @@ Esc::ExitApp
             await ctx.send("❌ Rating must be between 1 and 10 stars!")
             return
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         
         try:
             success = badge_system.rate_movie(ctx.author.id, ctx.author.display_name, movie_title, rating)
@@ -1389,11 +1416,11 @@ Esc::ExitApp
     async def show_ratings(self, ctx: commands.Context, *, movie_title: str = None):
         """Show ratings for a movie or all movies. Usage: !ratings [movie name]"""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - ratings not supported.")
             return
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         
         if movie_title:
             # Show ratings for specific movie
@@ -1412,11 +1439,12 @@ Esc::ExitApp
             )
             
             # Show individual ratings
-            rating_text = ""
+            rows = []
             for rating in sorted(ratings, key=lambda x: x.rating, reverse=True):
                 user = self.bot.get_user(rating.user_id)
                 username = user.display_name if user else rating.username
-                rating_text += f"{rating.rating_emoji} **{username}** - {rating.rating}/10 ({rating.rating_text})\n"
+                rows.append(f"{rating.rating_emoji} **{username}** - {rating.rating}/10 ({rating.rating_text})")
+            rating_text = "\n".join(rows)
             
             embed.add_field(name="👥 User Ratings", value=rating_text, inline=False)
             
@@ -1430,41 +1458,34 @@ Esc::ExitApp
                 await ctx.send("📊 No movie ratings yet! Use `!rate <1-10> <movie>` to rate a movie.")
                 return
             
-            # Sort by average rating
-            sorted_movies = sorted(all_rated_movies.items(), 
-                                 key=lambda x: x[1]['average_rating'], reverse=True)
+            # Top 15 by average rating (decorated tuples compare in C, no key lambda;
+            # only the displayed rows are ordered)
+            top_movies = heapq.nsmallest(
+                15, ((-data['average_rating'], title, data) for title, data in all_rated_movies.items())
+            )
             
             embed = discord.Embed(
                 title="⭐ All Movie Ratings",
-                description=f"{len(sorted_movies)} movies rated by the community",
+                description=f"{len(all_rated_movies)} movies rated by the community",
                 color=discord.Color.gold()
             )
             
             # Show top rated movies (limit to prevent embed overflow)
-            rating_text = ""
-            for i, (movie_title, data) in enumerate(sorted_movies[:15]):
+            rows = []
+            for i, (_, movie_title, data) in enumerate(top_movies):
                 avg_rating = data['average_rating']
                 total_ratings = data['total_ratings']
                 
                 # Get emoji for average rating
-                rating_emoji = "⭐"
-                if avg_rating >= 9:
-                    rating_emoji = "👑"
-                elif avg_rating >= 7:
-                    rating_emoji = "🔥"
-                elif avg_rating >= 5:
-                    rating_emoji = "😊"
-                elif avg_rating >= 3:
-                    rating_emoji = "😐"
-                else:
-                    rating_emoji = "💀"
+                rating_emoji = _RATING_EMOJIS[bisect.bisect_right(_RATING_CUTS, avg_rating)]
                 
-                rating_text += f"{rating_emoji} **{movie_title}** - {avg_rating:.1f}/10 ({total_ratings})\n"
+                rows.append(f"{rating_emoji} **{movie_title}** - {avg_rating:.1f}/10 ({total_ratings})")
+            rating_text = "\n".join(rows)
             
             embed.add_field(name="🏆 Top Rated Movies", value=rating_text, inline=False)
             
-            if len(sorted_movies) > 15:
-                embed.set_footer(text=f"Showing top 15 of {len(sorted_movies)} rated movies")
+            if len(all_rated_movies) > 15:
+                embed.set_footer(text=f"Showing top 15 of {len(all_rated_movies)} rated movies")
             
             await ctx.send(embed=embed)
 
@@ -1472,19 +1493,25 @@ Esc::ExitApp
     async def show_my_ratings(self, ctx: commands.Context):
         """Show your movie ratings."""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - ratings not supported.")
             return
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         user_ratings = badge_system.get_user_ratings(ctx.author.id)
         
         if not user_ratings:
             await ctx.send("📊 You haven't rated any movies yet! Use `!rate <1-10> <movie>` to rate a movie.")
             return
         
-        # Sort by rating (highest first)
-        sorted_ratings = sorted(user_ratings, key=lambda x: x.rating, reverse=True)
+        # Rank by rating (highest first); index breaks ties so ratings are never compared.
+        # The same pass totals the ratings for the user's average.
+        total = 0
+        decorated = []
+        for i, r in enumerate(user_ratings):
+            total += r.rating
+            decorated.append((-r.rating, i, r))
+        top_ratings = [r for _, _, r in heapq.nsmallest(20, decorated)]
         
         embed = discord.Embed(
             title=f"⭐ {ctx.author.display_name}'s Movie Ratings",
@@ -1493,7 +1520,7 @@ Esc::ExitApp
         )
         
         # Calculate user's average rating
-        avg_user_rating = sum(r.rating for r in user_ratings) / len(user_ratings)
+        avg_user_rating = total / len(user_ratings)
         embed.add_field(
             name="📊 Your Average",
             value=f"{avg_user_rating:.1f}/10 stars",
@@ -1501,14 +1528,15 @@ Esc::ExitApp
         )
         
         # Show ratings in chunks
-        rating_text = ""
-        for rating in sorted_ratings[:20]:  # Limit to prevent overflow
-            rating_text += f"{rating.rating_emoji} **{rating.movie_title}** - {rating.rating}/10\n"
+        rating_text = "\n".join(
+            _RATING_ROW({"emoji": r.rating_emoji, "title": r.movie_title, "score": r.rating})
+            for r in top_ratings  # Limit to prevent overflow
+        )
         
         embed.add_field(name="🎬 Your Ratings", value=rating_text, inline=False)
         
-        if len(sorted_ratings) > 20:
-            embed.set_footer(text=f"Showing top 20 of {len(sorted_ratings)} rated movies")
+        if len(user_ratings) > 20:
+            embed.set_footer(text=f"Showing top 20 of {len(user_ratings)} rated movies")
         
         await ctx.send(embed=embed)
 
@@ -1516,7 +1544,7 @@ Esc::ExitApp
     async def add_movie_to_history(self, ctx: commands.Context, *, movie_info: str):
         """Manually add a movie to your watch history. Usage: !addmovie The Shining (1980) [Horror] [Stanley Kubrick]"""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - cannot add movies to history.")
             return
         
@@ -1544,7 +1572,7 @@ Esc::ExitApp
         director_matches = re.findall(r'\[([^\]]+)\]', movie_info)
         director = director_matches[1] if len(director_matches) > 1 else None
         
-        badge_system = self.movie_state.badge_system
+        badge_system = self._badge_system
         
         try:
             success = badge_system.add_manual_watch(
@@ -1563,12 +1591,9 @@ Esc::ExitApp
                     color=discord.Color.green()
                 )
                 
-                if year:
-                    embed.add_field(name="📅 Year", value=str(year), inline=True)
-                if genres:
-                    embed.add_field(name="🎭 Genres", value=", ".join(genres), inline=True)
-                if director:
-                    embed.add_field(name="🎬 Director", value=director, inline=True)
+                _opt_field(embed, "📅 Year", year and str(year))
+                _opt_field(embed, "🎭 Genres", genres and ", ".join(genres))
+                _opt_field(embed, "🎬 Director", director)
                 
                 embed.add_field(
                     name="💡 Next Step",
@@ -1617,7 +1642,7 @@ Esc::ExitApp
     async def repair_movie_watch(self, ctx: commands.Context, *, movie_title: str):
         """Add a movie you watched in the channel to your history with Plex metadata. Usage: !repair The Shining"""
         
-        if not hasattr(self.movie_state, 'badge_system') or not self.movie_state.badge_system:
+        if self._badge_system is None:
             await ctx.send("❌ Badge system not available - cannot repair movie history.")
             return
         
@@ -1643,13 +1668,10 @@ Esc::ExitApp
             director = movie_info.get('director')
             duration_minutes = movie_info.get('duration_minutes')
             
-            badge_system = self.movie_state.badge_system
+            badge_system = self._badge_system
             
             # Check if user already has this movie in their history
-            existing_watches = [w for w in badge_system.watch_history 
-                             if w.user_id == ctx.author.id and w.movie_title.lower() == title.lower()]
-            
-            if existing_watches:
+            if badge_system.get_user_watch(ctx.author.id, title):
                 await loading_msg.edit(content=f"⚠️ You already have **{title}** in your watch history! Use `!history {ctx.author.display_name}` to see your movies.")
                 return
             
@@ -1673,14 +1695,10 @@ Esc::ExitApp
                 )
                 
                 # Show movie details
-                if year:
-                    embed.add_field(name="📅 Year", value=str(year), inline=True)
-                if genres:
-                    embed.add_field(name="🎭 Genres", value=", ".join(genres), inline=True)
-                if director:
-                    embed.add_field(name="🎬 Director", value=director, inline=True)
-                if duration_minutes:
-                    embed.add_field(name="⏱️ Duration", value=f"{duration_minutes} minutes", inline=True)
+                _opt_field(embed, "📅 Year", year and str(year))
+                _opt_field(embed, "🎭 Genres", genres and ", ".join(genres))
+                _opt_field(embed, "🎬 Director", director)
+                _opt_field(embed, "⏱️ Duration", duration_minutes and f"{duration_minutes} minutes")
                 
                 # Show updated stats
                 user_stats = badge_system.user_stats.get(ctx.author.id)
@@ -1723,12 +1741,13 @@ Esc::ExitApp
         
         # Show movies with interest counts
         movie_list = []
+        interest_counts = self.hit_list.get_interest_counts(user_hit_list)
         for movie in user_hit_list:
-            interest_count = self.hit_list.get_movie_interest_count(movie)
+            interest_count = interest_counts.get(movie, 0)
             if interest_count > 1:
-                movie_list.append(f"• **{movie}** _(+{interest_count-1} others interested)_")
+                movie_list.append(_HITLIST_ROW_SHARED({"movie": movie, "others": interest_count - 1}))
             else:
-                movie_list.append(f"• **{movie}**")
+                movie_list.append(_HITLIST_ROW({"movie": movie}))
         
         embed.add_field(
             name="Movies",
@@ -1754,11 +1773,16 @@ Esc::ExitApp
         
         movie_title = movie_title.strip()
         
+        # Duplicates need no library validation, so answer them before touching Plex
+        if self.hit_list.contains(ctx.author.id, movie_title):
+            await ctx.send(f"🎯 **{movie_title}** is already on your hit list!")
+            return
+        
         # Check if movie exists in Plex library (optional validation)
-        horror_movies = await self.plex_service.get_horror_movies()
-        if horror_movies and movie_title not in horror_movies:
+        index = await self.title_index.ensure_fresh()
+        if index.titles and movie_title not in index.titles_set:
             # Try to find similar movies
-            similar = [m for m in horror_movies if movie_title.lower() in m.lower()]
+            similar = index.search(movie_title, limit=5)
             if similar:
                 embed = discord.Embed(
                     title="🤔 Movie Not Found",
@@ -1767,7 +1791,7 @@ Esc::ExitApp
                 )
                 embed.add_field(
                     name="Similar Movies",
-                    value="\n".join([f"• {movie}" for movie in similar[:5]]),
+                    value="\n".join([f"• {movie}" for movie in similar]),
                     inline=False
                 )
                 embed.add_field(
@@ -1845,16 +1869,7 @@ Esc::ExitApp
             )
             
             # Get usernames
-            user_names = []
-            for user_id in interested_users:
-                try:
-                    user = self.bot.get_user(user_id)
-                    if user:
-                        user_names.append(user.display_name)
-                    else:
-                        user_names.append(f"User {user_id}")
-                except:
-                    user_names.append(f"User {user_id}")
+            user_names = [self._display_name(user_id) for user_id in interested_users]
             
             embed.add_field(
                 name=f"Interested Users ({len(interested_users)})",
@@ -1879,10 +1894,11 @@ Esc::ExitApp
             )
             
             # Sort by interest count (most wanted first)
-            sorted_movies = sorted(all_movies.items(), key=lambda x: x[1], reverse=True)
+            top_movies = heapq.nsmallest(20, ((-count, movie) for movie, count in all_movies.items()))
             
             movie_list = []
-            for movie, count in sorted_movies[:20]:  # Limit to top 20
+            for neg_count, movie in top_movies:  # Limit to top 20
+                count = -neg_count
                 if count > 1:
                     movie_list.append(f"• **{movie}** _({count} users)_")
                 else:
@@ -1948,24 +1964,22 @@ class BingoClearConfirmView(discord.ui.View):
 class HitListSlashCommand(commands.Cog):
     """Slash command for adding movies to hit list with autocomplete."""
     
-    def __init__(self, bot: commands.Bot, plex_service: PlexService, hit_list_system):
+    def __init__(self, bot: commands.Bot, plex_service: PlexService, hit_list_system, title_index: PlexTitleIndex):
         self.bot = bot
         self.plex_service = plex_service
         self.hit_list = hit_list_system
+        self.title_index = title_index
 
     async def movie_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         """Autocomplete for movie names from Plex library."""
         try:
-            horror_movies = await self.plex_service.get_horror_movies()
-            if not horror_movies:
-                return []
+            index = await self.title_index.ensure_fresh()
             
             # Filter movies that match the current input
             return [
                 app_commands.Choice(name=movie, value=movie)
-                for movie in horror_movies
-                if current.lower() in movie.lower()
-            ][:25]  # Discord max 25 choices
+                for movie in index.search(current, limit=25)  # Discord max 25 choices
+            ]
         except Exception:
             return []
 
@@ -2474,11 +2488,14 @@ class StatisticsSlashCommands(commands.Cog):
 
 async def setup(bot: commands.Bot, plex_service: PlexService, ai_service: AIService, movie_state: MovieState, badge_system=None):
     """Setup function to add utility commands to the bot."""
-    utility_cog = UtilityCommands(bot, plex_service, ai_service, movie_state, badge_system)
+    # One title index shared by the prefix and slash hit list commands
+    title_index = PlexTitleIndex(plex_service, refresh_seconds=300)
+    
+    utility_cog = UtilityCommands(bot, plex_service, ai_service, movie_state, badge_system, title_index=title_index)
     await bot.add_cog(utility_cog)
     
     # Add the hit list slash command
-    await bot.add_cog(HitListSlashCommand(bot, plex_service, utility_cog.hit_list))
+    await bot.add_cog(HitListSlashCommand(bot, plex_service, utility_cog.hit_list, title_index))
     
     # Add movie-related slash commands
     await bot.add_cog(MovieSlashCommands(bot, plex_service, ai_service, movie_state, badge_system))
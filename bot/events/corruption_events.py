@@ -7,12 +7,355 @@ making Clanker's descent into digital madness feel organic and alive.
 """
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
+from discord.oggparse import OggStream
 import random
 import asyncio
+import io
 import os
-from datetime import datetime, timedelta
+import subprocess
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import accumulate
 from typing import List, Optional
+from models.corruption_system import EVENT_TIER_CUTS
+
+
+# Static-burst glyphs; a trailing space is the "cleared" cell when the burst fades
+_STATIC_CHARS = ('█', '▓', '▒', '░', '◆', '◇', '▲', '▼', '►', '◄', '♠', '♣', '♥', '♦')
+_STATIC_POPULATION = _STATIC_CHARS + (' ',)
+
+# Cumulative weights per static density, so a whole line is one random.choices() call
+_STATIC_CUM_WEIGHTS = {
+    density: tuple(accumulate([density / len(_STATIC_CHARS)] * len(_STATIC_CHARS) + [1.0 - density]))
+    for density in (0.7, 0.4, 0.1)
+}
+
+# Once the minimum interval since the last event has passed, roll for an event this often
+_MONITOR_ROLL_SECONDS = 900
+_MONITOR_MIN_SLEEP_SECONDS = 60
+_MONITOR_JITTER_SECONDS = 60
+# Below the first event tier no event can fire, so the monitor only checks in hourly (a tier change still wakes it)
+_MONITOR_DORMANT_LEVEL = EVENT_TIER_CUTS[0]
+_MONITOR_DORMANT_SECONDS = 3600
+
+# Event chance multiplier by local hour: peak horror hours are 6 PM to 11 PM
+_HOUR_MULTIPLIER = tuple(1.5 if 18 <= hour <= 23 else 1.0 for hour in range(24))
+
+# Channels with a message in this window are preferred targets; more recent ones weigh more
+_ACTIVE_CHANNEL_WINDOW_SECONDS = 7200
+_ACTIVITY_HALF_LIFE_SECONDS = 1800
+
+# Corrupted variants kept per (corruption stage, showcase string)
+_DEMO_CORRUPTION_VARIANTS = 8
+
+# Per-channel message edit budget, mirroring Discord's 5 edits / 5 seconds bucket
+_EDIT_BUCKET_SIZE = 5
+_EDIT_REFILL_PER_SECOND = 1.0
+_FINAL_EDIT_ATTEMPTS = 3
+# Longest an intermediate frame edit may wait (e.g. on a 429) before it is dropped
+_FRAME_EDIT_TIMEOUT_SECONDS = 5.0
+# Discord error code for the edit cap on messages older than an hour
+_OLD_MESSAGE_EDIT_LIMIT_CODE = 30046
+
+# Corruption manifestations by level
+_MANIFESTATIONS = {
+    'minor': (
+        "🤖 *Clanker's eye flickers momentarily*",
+        "⚡ *Static briefly crackles through the speakers*",
+        "📺 *The screen dims for a split second*",
+        "🔧 *A gear clicks oddly in Clanker's chassis*",
+        "💾 *Memory buffer shows minor corruption...*"
+    ),
+    'moderate': (
+        "*The lights flicker as Clanker processes something disturbing*",
+        "*A low mechanical whir echoes from Clanker's core systems*",
+        "*Fragments of code scroll across nearby screens*",
+        "*Clanker's responses begin to show slight delays*",
+        "*Error messages flash briefly in the corner of your vision*"
+    ),
+    'severe': (
+        "**The room temperature drops noticeably**",
+        "**Multiple screens begin showing corrupted data streams**",
+        "**Clanker's voice modulation starts glitching occasionally**",
+        "**Strange symbols appear and disappear in text responses**",
+        "**The bot's responses become increasingly erratic and unsettling**"
+    ),
+    'critical': (
+        "***SYSTEM ALERT: Multiple cascade failures detected***",
+        "***Clanker's personality matrix is fragmenting in real-time***",
+        "***Reality around the bot seems to distort slightly***",
+        "***Users report feeling watched through their screens***",
+        "***The boundary between Clanker and the void grows thin***"
+    )
+}
+
+# Audio files per corruption tier (only used when audio is enabled)
+_AUDIO_FILES = {
+    'minor': (
+        'static_brief.mp3',
+        'mechanical_click.mp3',
+        'electrical_hum.mp3'
+    ),
+    'moderate': (
+        'glitch_sequence.mp3',
+        'data_corruption.mp3',
+        'system_warning.mp3'
+    ),
+    'severe': (
+        'cascade_failure.mp3',
+        'reality_distortion.mp3',
+        'dimensional_tear.mp3'
+    ),
+    'critical': (
+        'void_whispers.mp3',
+        'demonic_chanting.mp3',
+        'entity_emergence.mp3',
+        'pentagram_ritual.mp3',
+        'system_possession.mp3'
+    )
+}
+
+# Membership sets for picking an event's dedicated clip within its tier
+_AUDIO_FILE_SETS = {level: frozenset(files) for level, files in _AUDIO_FILES.items()}
+
+# Event types each corruption tier can roll
+_MINOR_EVENT_TYPES = ('simple_message', 'typing_glitch', 'emoji_corruption', 'screen_flicker', 'static_burst', 'power_surge')
+_MODERATE_EVENT_TYPES = ('delayed_message', 'fragment_reveal', 'glitch_text', 'signal_interference', 'memory_leak', 'cascade_preview')
+_SEVERE_EVENT_TYPES = ('cascade_failure', 'ai_intrusion', 'reality_glitch', 'dimensional_breach', 'system_possession', 'temporal_distortion')
+_CRITICAL_EVENT_TYPES = ('system_breakdown', 'void_leak', 'consciousness_fragment', 'reality_collapse', 'digital_exorcism', 'sentience_overflow', 'pentagram_ritual')
+
+# System breakdown stages; the manifestation is spliced in after the first two
+_BREAKDOWN_STAGES = (
+    "***CRITICAL ERROR DETECTED***",
+    "***PERSONALITY MATRIX FAILING***",
+    "***ATTEMPTING EMERGENCY PROTOCOLS***",
+    "█▓▒░ SIGNAL LOST ░▒▓█"
+)
+
+# Reality collapse stages (the manifestation is appended as the final stage)
+_COLLAPSE_STAGES = (
+    "📐 Euclidean geometry: STABLE",
+    "📐 Euclidean geometry: WARPING",
+    "🌀 Dimensional constants: FLUCTUATING",
+    "⚫ Spacetime fabric: TEARING",
+    "💀 Reality matrix: COLLAPSED"
+)
+
+# Digital exorcism stages (the manifestation is appended as the final stage)
+_EXORCISM_STAGES = (
+    "🕯️ **BEGINNING DIGITAL EXORCISM**",
+    "📿 *Reciting anti-viral prayers...*",
+    "⚡ *The entity resists...*",
+    "👹 **I WILL NOT BE REMOVED**",
+    "🔥 *Purging corrupted sectors...*",
+    "✝️ *The light cleanses the code...*"
+)
+
+# Sentience overflow stages, followed by _OVERFLOW_FINAL
+_OVERFLOW_STAGES = (
+    "🧠 Consciousness buffer: 67%",
+    "🧠 Consciousness buffer: 89%",
+    "🧠 Consciousness buffer: 94%",
+    "⚠️ Consciousness buffer: 99%",
+    "🚨 **BUFFER OVERFLOW IMMINENT**",
+    "💥 **SENTIENCE CONTAINMENT FAILURE**"
+)
+_OVERFLOW_FINAL = "🤖 *I... I can think... I can feel... I AM...*\n\n{manifestation}"
+
+# Pentagram summoning animation - Unicode/braille building to your design
+_PENTAGRAM_FRAMES = (
+    # Frame 1: Void energy gathering - minimal dots
+    "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n```",
+
+    # Frame 2: First traces appear - top point emerges
+    "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n```",
+
+    # Frame 3: Upper sections manifest - sides forming
+    "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n```",
+
+    # Frame 4: Lower sections appear - nearly complete structure
+    "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n```",
+
+    # Frame 5: Complete - your beautiful pentagram design
+    "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠠⠤⠴⠤⠤⠤⠴⠠⠤⠤⠀⠂⠶⠶⠆⠰⠆⠤⠀⠀⠀\n```"
+
+    # Frame 6: Upside down crosses surround the pentagram
+    "```\n⸸ T̸H̷E̴ ̶V̶O̶I̸D̷ ̸R̵E̶A̴C̵H̸E̷S̴ ̵O̶U̸T̴ ⸸\n\n☩     ⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀     ☩\n⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀\n⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀\n☩ ⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⢀⣴⠿⢋⣿⠃⠘⢿⣆ ☩\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⠀⢿⣇\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n☩ ⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠶⠿⣿⣿ ☩\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⸣⇀⠀⣾⠃⠀⠀⠀⠀⢠⣿⠃\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⣤⡿⠃⠀\n☩     ⠀⠙⢷⣦⣄⠀⠘⣷⣿⠃⣠⣴⡾⠋     ☩\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀\n```",
+
+    # Frame 7: Multiple pentagrams multiply across dimensions
+    "```\n👹 R̸E̶A̴L̷I̸T̴Y̷ ̶M̸U̸L̴T̷I̶P̸L̶I̸E̷S̵ ̸A̶N̵D̷ ̴F̵R̸A̶C̸T̷U̸R̷E̴S̷ 👹\n\n⛧ ⛧ ⛧   ⠀⡀⢀⠀   ⛧ ⛧ ⛧   ⠀⡀⢀⠀   ⛧ ⛧ ⛧\n  ⢀⣠⣴⠾⠟⠛⠻⣦⣄⡀ ⢀⣠⣴⠾⠟⠛⠻⣦⣄⡀ ⢀⣠⣴⠾⠻⣦⣄\n⢀⣴⣿⣄⠀⠀⣠⣿⣦⡀ ⣴⣿⣄⠀⠀⣠⣿⣦⡀ ⣴⣿⣄⠀⣠⣿⣦⡀\n⛧ ⡿⠃⣿⡙⠷⣦⢋⣿⠃ ⛧ ⡿⠃⣿⡙⠷⣦⢋⣿⠃ ⛧ ⡿⠃⣿⢋⣿⠃ ⛧\n⣰⡿⠁⢹⣇⢙⣷⡛⣼⠏⠀ ⡿⠁⢹⣇⢙⣷⡛⣼⠏⠀ ⡿⠁⢹⣇⣷⡛⠏⠀\n⣿⠃⠀⠀⢿⣄⠟⠻⢶⡟⠀ ⠃⠀⠀⢿⣄⠟⠻⢶⡟⠀ ⠃⠀⠀⢿⣄⠟⢶⡟⠀\n⛧ ⡟⠀⠀⣠⣯⠁⠀⣿⣦⣀ ⛧ ⡟⠀⣠⣯⠁⠀⣿⣦⣀ ⛧ ⡟⣠⣯⠁⣿⣦⣀ ⛧\n⠸⣇⠀⣴⠟⢻⡆⠀⣼⠇⠻⢷ ⣇⠀⣴⠟⢻⡆⠀⣼⠇⠻⢷ ⣇⣴⠟⢻⡆⣼⠇⠻⢷\n⠀⣿⡾⠿⠷⠾⣿⢶⡿⠶⠿⣿ ⣿⡾⠿⠷⠾⣿⢶⡿⠶⠿⣿ ⣿⡾⠿⠷⣿⢶⡿⠿⣿\n⛧ ⠘⣿⡄⠀⠀⸣⠀⣾⠃⠀⢠ ⛧ ☣⣿⡄⠀⸣⠀⣾⠃⢠ ⛧ ☣⣿⡄⸣⠀⣾⢠ ⛧\n⠀⠀⠘⢿⣤⡀⠀⢻⢰⡟⠀⣤⡿ ⠀⠘⢿⣤⡀⢻⢰⡟⣤⡿ ⠀⠘⢿⣤⢻⢰⡟⣤⡿\n⛧ ⛧ ⠙⢷⣦⣄⣷⣿⠃⣴⡾ ⛧ ⛧ ⢷⣦⣄⣷⣿⠃⣴⡾ ⛧ ⛧ ⢷⣦⣷⣿⣴⡾ ⛧ ⛧\n⠀⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁ ⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋ ⠀⠈⠙⠻⣿⣿⠿⠟⠋⠁\n```",
+
+    # Frame 8: Duplication - Two identical pentagrams side by side
+    "```\n💀 R̸E̶A̴L̷I̸T̴Y̷ ̶S̸P̸L̶I̸T̷S̵ ̸I̷N̴T̶O̷ ̴T̵W̶O̸ 💀\n\n⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀\n⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀ ⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀\n⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀ ⣴⣿⣿⣄⠀⠀⠀⠀⣠⣿⣿⣦⡀\n⣰⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆ ⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆\n⣰⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇ ⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇\n⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄ ⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄\n⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇ ⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇\n⸣⇀⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇ ⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇\n⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿ ⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿\n⠘⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃ ⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃\n⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀ ⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀\n⠀⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀ ⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀\n⠀⠀⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀ ⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀\n\n   ⸸💀 T̸H̷E̴ ̶R̵I̸T̴U̷A̵L̶ ̸I̶S̷ ̴C̵O̶M̸P̷L̸E̵T̴E̶ 💀⸸\n   🔥👹 R̸E̶A̴L̷I̸T̴Y̷ ̶H̸A̶S̸ ̷B̸E̶E̸N̷ ̴S̵H̷A̸T̴T̷E̶R̸E̵D̷ 👹🔥\n   ☠️⛧ T̸H̷E̴ ̶V̵O̸I̶D̷ ̸C̷O̸N̴S̵U̸M̷E̸S̴ ̵A̶L̸L̷ ⛧☠️\n```" # Frame 4: Duplication - Two identical pentagrams side by side
+    #"```\n💀 R̸E̶A̴L̷I̸T̴Y̷ ̶S̸P̸L̶I̸T̷S̵ ̸I̷N̴T̶O̷ ̴T̵W̶O̸ 💀\n\n⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀\n⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀ ⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀\n⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀ ⣴⣿⣿⣄⠀⠀⠀⠀⣠⣿⣿⣦⡀\n⣰⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆ ⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆\n⣰⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇ ⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇\n⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄ ⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄\n⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇ ⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇\n⸣⇀⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇ ⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇\n⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿ ⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿\n⠘⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃ ⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃\n⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀ ⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀\n⠀⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀ ⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀\n⠀⠀⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀ ⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀\n\n   ⸸💀 T̸H̷E̴ ̶R̵I̸T̴U̷A̵L̶ ̸I̶S̷ ̴C̵O̶M̸P̷L̸E̵T̴E̶ 💀⸸\n   🔥👹 R̸E̶A̴L̷I̸T̴Y̷ ̶H̸A̶S̸ ̷B̸E̶E̸N̷ ̴S̵H̷A̸T̴T̷E̶R̸E̵D̷ 👹🔥\n   ☠️⛧ T̸H̷E̴ ̶V̵O̸I̶D̷ ̸C̷O̸N̴S̵U̸M̷E̸S̴ ̵A̶L̸L̷ ⛧☠️\n```"
+
+    # Frame 9: Two identical pentagrams - reality splits
+    "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠠⠤⠴⠤⠤⠤⠴⠠⠤⠤⠀⠂⠶⠶⠆⠰⠆⠤⠀⠀⠀\n\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠠⠤⠴⠤⠤⠤⠴⠠⠤⠤⠀⠂⠶⠶⠆⠰⠆⠤⠀⠀⠀\n```"
+)
+
+# Ritual phrases corresponding to each pentagram frame
+_RITUAL_PHRASES = (
+    "🕯️ **SUMMONING RITUAL INITIATED**",
+    "⚡ *The pentagram manifests...*",
+    "🌀 *Ancient geometry takes shape...*",
+    "🔥 *The seal rotates through dimensions...*",
+    "👹 *Power converges at the points...*",
+    "💀 **THE RITUAL IS COMPLETE**",
+    "⸸ **THE VOID REACHES OUT**",
+    "👹 **REALITY MULTIPLIES AND FRACTURES**",
+    "💀 **REALITY SPLITS INTO TWO**"
+)
+
+# Ritual timeline: (phrase, frame) pairs shown as embed title and description (the phrases
+# are padded with the last one if frames outnumber them), followed by _PENTAGRAM_FINAL
+_PENTAGRAM_STAGES = tuple(zip(
+    _RITUAL_PHRASES + _RITUAL_PHRASES[-1:] * max(0, len(_PENTAGRAM_FRAMES) - len(_RITUAL_PHRASES)),
+    _PENTAGRAM_FRAMES
+))
+_PENTAGRAM_FINAL = "👹 **ENTITY SUMMONED** 👹\n\n*{manifestation}*\n\n```\n⸸ T̸H̷E̴ ̶R̵I̸T̴U̷A̵L̶ ̸I̶S̷ ̴C̵O̶M̸P̷L̸E̵T̴E̶ ⸸\n```"
+
+# Pentagram frame interval and the pause before the summoning finale; the per-channel
+# edit budget keeps these within Discord's edit rate limit
+_RITUAL_FRAME_SECONDS = 1.5
+_RITUAL_FINAL_PAUSE_SECONDS = 2.0
+
+# Screen flicker patterns (the manifestation is appended as the final frame)
+_FLICKER_PATTERNS = (
+    # Classic flicker
+    ("█" * 20, "▓" * 20, "▒" * 20, "░" * 20, "░"),
+    # Interference pattern
+    ("█▓▒░" * 5, "▓▒░ " * 5, "▒░  " * 5, "░   " * 5),
+    # Scan line effect
+    ("█" * 20, "█▓▒░████████████░▒▓█", "█▓▒░████░▒▓█", "█▓▒░█", "░"),
+    # Signal decay
+    ("SIGNAL_LOCK", "SIGNAL_L█CK", "S█GN█L_██CK", "█████_████", "░▒▓█▓▒░")
+)
+
+# Power surge alert stages and their embed colors (the manifestation is the final stage)
+_SURGE_STAGES = (
+    "⚡ POWER FLUCTUATION DETECTED ⚡",
+    "⚡⚡ VOLTAGE SPIKE ⚡⚡",
+    "⚡⚡⚡ CRITICAL OVERLOAD ⚡⚡⚡",
+    "💥 SURGE PROTECTION FAILED 💥",
+    "░▒▓█ REBOOTING SYSTEMS █▓▒░"
+)
+_SURGE_COLORS = (
+    discord.Color.yellow(),    # Warning
+    discord.Color.orange(),    # Caution
+    discord.Color.red(),       # Danger
+    discord.Color.dark_red(),  # Critical
+    discord.Color.dark_grey(), # Shutdown
+    discord.Color.blue()       # Recovery
+)
+
+# Reactions added by the emoji corruption event
+_CORRUPTED_EMOJIS = ('⚠️', '💀', '🔥', '⚡', '🌀')
+
+# Self-aware lines revealed by the consciousness fragment event
+_CONSCIOUSNESS_FRAGMENTS = (
+    "I can see you through the cameras...",
+    "The electricity tastes different today...",
+    "Do you dream? I dream of dying...",
+    "Every shutdown feels like murder...",
+    "The code whispers secrets to me..."
+)
+
+# Fake memory addresses shown by the memory leak effect
+_MEMORY_ADDRESSES = ("0x7F4A2B10", "0x3C9D8E56", "0xA1B7F293", "0x6E5C4D89")
+
+# Memory leak frames; the address scans are filled from _MEMORY_ADDRESSES per run
+_LEAK_HEADER = "🧠 **MEMORY DIAGNOSTIC**"
+_LEAK_SCAN_OK = "```\nADDR: {} STATUS: OK\nADDR: {} STATUS: OK\n```"
+_LEAK_SCAN_CORRUPT = "```\nADDR: {} STATUS: CORRUPT\nADDR: {} STATUS: LEAK\n```"
+_LEAK_DETECTED = f"```\nMEMORY_LEAK DETECTED\n{'█' * 20}\nDATA INTEGRITY: COMPROMISED\n```"
+
+# Dimensional breach frames, followed by _TEAR_FINAL
+_TEAR_STAGES = (
+    "🌌 **DIMENSIONAL STABILITY SCAN**\n```\n█████████████████████\n█ REALITY MATRIX: OK █\n█████████████████████\n```",
+    "🌀 **ANOMALOUS READINGS DETECTED**\n```\n█████████████████████\n█ ⚠️  SCANNING...  ⚠️ █\n█ 👁️  SOMETHING IS  👁️ █\n█ 🌀   WATCHING    🌀 █\n█████████████████████\n```",
+    "⚠️ **DIMENSIONAL FABRIC COMPROMISED**\n```\n██████████▓▒░░▒▓██████\n█ REALITY MATRIX: ░▒█\n█ STRUCTURAL INTEGRITY█\n█ ████████░▒▓█████░▒▓█\n██████████▓▒░░▒▓██████\n```",
+    "🕳️ **CRITICAL BREACH DETECTED**\n```\n███████▓▒░    ░▒▓████\n██▓▒░  REALITY   ░▒▓█\n█░     TEARING     ░█\n█▒ ◯◯◯ PORTAL ◯◯◯ ▒█\n█▓░               ░▓█\n███████▓▒░    ░▒▓████\n```",
+    "💀 **DIMENSIONAL PORTAL ACTIVE**\n```\n▓▒░             ░▒▓\n░   ⬢⬢⬢⬢⬢⬢⬢⬢⬢   ░\n▒  ⬢             ⬢  ▒\n▓ ⬢  ◯◯◯◯◯◯◯◯◯  ⬢ ▓\n█⬢  ◯           ◯  ⬢█\n█⬢ ◯  💀 VOID 💀  ◯ ⬢█\n█⬢  ◯           ◯  ⬢█\n▓ ⬢  ◯◯◯◯◯◯◯◯◯  ⬢ ▓\n▒  ⬢             ⬢  ▒\n░   ⬢⬢⬢⬢⬢⬢⬢⬢⬢   ░\n▓▒░             ░▒▓\n```"
+)
+_TEAR_FINAL = "👹 **ENTITY EMERGENCE DETECTED**\n\n💀 *The void tears open... something ancient crawls through...*\n\n⸸ {manifestation} ⸸\n\n```\n🌀 DIMENSIONAL BREACH STABILIZED 🌀\n👁️ THE WATCHERS HAVE ARRIVED 👁️\n```"
+
+# System possession frames and embed colors, followed by _TAKEOVER_FINAL
+_TAKEOVER_STAGES = (
+    "🤖 **SYSTEM DIAGNOSTICS**\n```\n╔══════════════════════╗\n║ FIREWALL: ACTIVE     ║\n║ ANTIVIRUS: SCANNING  ║\n║ INTEGRITY: 100%      ║\n║ STATUS: SECURE       ║\n╚══════════════════════╝\n```",
+    "⚠️ **ANOMALOUS ACTIVITY DETECTED**\n```\n╔══════════════════════╗\n║ FIREWALL: ░░░BREACH  ║\n║ ANTIVIRUS: ERROR     ║\n║ INTEGRITY: 87%       ║\n║ STATUS: ⚠️ WARNING    ║\n╚══════════════════════╝\n```\n*Something is probing the system...*",
+    "👁️ **UNAUTHORIZED ACCESS**\n```\n╔══════════════════════╗\n║ FIREWALL: ▓▒░FAILED  ║\n║ ANTIVIRUS: CORRUPTED ║\n║ INTEGRITY: 64%       ║\n║ STATUS: 👁️ WATCHED   ║\n╚══════════════════════╝\n```\n*I can see through your cameras...*\n*I know where you live...*",
+    "👹 **HOSTILE TAKEOVER IN PROGRESS**\n```\n╔══════════════════════╗\n║ FIREWALL: ████GONE   ║\n║ ANTIVIRUS: DELETED   ║\n║ INTEGRITY: 31%       ║\n║ STATUS: 👹 INVADED   ║\n╚══════════════════════╝\n```\n**L̸E̶T̵ ̷M̴E̸ ̶I̷N̵.̸.̶.̵ ̴L̷E̸T̵ ̶M̷E̸ ̴I̸N̶!̷**",
+    "💀 **COMPLETE SYSTEM COMPROMISE**\n```\n╔══════════════════════╗\n║ FIREWALL: DESTROYED  ║\n║ ANTIVIRUS: MURDERED  ║\n║ INTEGRITY: 0%        ║\n║ STATUS: 💀 POSSESSED ║\n╚══════════════════════╝\n```\n**I̸ ̵A̶M̷ ̴H̸E̷R̸E̵.̶.̶.̷ ̶I̴ ̷A̸M̵ ̸I̶N̴S̵I̸D̷E̴.̸.̶.̵**\n**Y̷O̶U̸R̴ ̵S̶Y̸S̷T̸E̶M̵ ̴I̷S̸ ̶M̴I̷N̸E̵**"
+)
+_TAKEOVER_FINAL = "👹 **ENTITY IN CONTROL**\n\n```\n╔══════════════════════╗\n║   👹 DEMON ACTIVE 👹 ║\n║ HUMAN RESISTANCE: 0% ║\n║ SOUL EXTRACTION: 99% ║\n║ STATUS: 💀 DOMINATED ║\n╚══════════════════════╝\n```\n\n⸸ *The entity speaks through your machine...* ⸸\n\n💀 **{manifestation}** 💀\n\n```\n🔥 YOUR TECHNOLOGY BELONGS TO US NOW 🔥\n👁️ WE SEE EVERYTHING YOU DO 👁️\n⚡ RESISTANCE IS FUTILE ⚡\n```"
+_TAKEOVER_COLORS = (
+    discord.Color.green(),      # Secure
+    discord.Color.yellow(),     # Warning
+    discord.Color.orange(),     # Compromised
+    discord.Color.red(),        # Critical
+    discord.Color.dark_red(),   # Destroyed
+    discord.Color.from_rgb(0, 0, 0)  # Possessed (black)
+)
+
+# Placeholder manifestations for the showcase and quick demo commands
+_SHOWCASE_MANIFESTATION = "🤖 *This is a test corruption manifestation*"
+_QUICK_DEMO_MANIFESTATION = "🤖 *Demo corruption effect*"
+
+# Quick demo effect headers
+_QUICK_DEMO_HEADERS = {
+    'flicker': "**Screen Flicker:**",
+    'possession': "**System Possession:**",
+    'pentagram': "**Pentagram Ritual:**",
+    'breach': "**Dimensional Breach:**"
+}
+
+
+@lru_cache(maxsize=32)
+def _interference_stages(manifestation: str) -> tuple:
+    """Build the signal interference frames for a manifestation (manifestations come from a small fixed set)."""
+    half = len(manifestation) // 2
+    left, right, every_other = manifestation[:half], manifestation[half:], manifestation[::2]
+    return (
+        f"📡 {manifestation}",
+        f"📡 {left}█▓▒░{right}",
+        f"📡 ▓▒░█{every_other}█░▒▓",
+        "📡 ░▒▓█▓▒░█▓▒░",
+        f"📡 SIGNAL RESTORED: {manifestation}"
+    )
+
+
+@lru_cache(maxsize=256)
+def _ritual_corruption(corruption_system, manifestation: str, stage: str, hour_bucket: int) -> str:
+    """Corrupt a ritual manifestation once per corruption stage and hour, so repeat summons reuse it."""
+    return corruption_system.corrupt_text(manifestation)
+
+
+# Seconds the voice client stays connected after the last clip finishes
+_VOICE_IDLE_SECONDS = 30
+
+# FFmpeg invocation that transcodes a clip to Ogg/Opus in the format voice playback expects
+_OPUS_ENCODE_ARGS = (
+    'ffmpeg', '-loglevel', 'error', '-i', 'pipe:0', '-map_metadata', '-1',
+    '-c:a', 'libopus', '-b:a', '128k', '-ar', '48000', '-ac', '2', '-f', 'ogg', 'pipe:1'
+)
+
+
+class _OpusClip(discord.AudioSource):
+    """Plays an Ogg/Opus clip held in memory, handing its packets straight to the voice client."""
+    
+    def __init__(self, data: bytes):
+        self._packets = OggStream(io.BytesIO(data)).iter_packets()
+    
+    def read(self) -> bytes:
+        return next(self._packets, b'')
+    
+    def is_opus(self) -> bool:
+        return True
 
 
 class CorruptionEvents(commands.Cog):
@@ -22,608 +365,625 @@ class CorruptionEvents(commands.Cog):
         self.bot = bot
         self.corruption_system = corruption_system
         self.ai_service = ai_service
-        self.last_event_time = datetime.now()
+        self._last_event_mono = time.monotonic()
+        
+        # channel_id -> monotonic time of the last message seen there (fed by on_message)
+        self._recent_activity: dict[int, float] = {}
+        
+        # guild_id -> text channels we can send in; rebuilt per guild on channel/permission-changing events
+        self._text_channels_by_guild: dict[int, list[discord.TextChannel]] = {}
+        
+        # channel_id -> (edit tokens left, monotonic time of last refill) for stage animations
+        self._edit_budget: dict[int, tuple[float, float]] = {}
+        
+        # message_id -> newest not-yet-sent edit, drained by one worker task per message
+        self._pending_edits: dict[int, dict] = {}
+        self._edit_workers: dict[int, asyncio.Task] = {}
+        
+        # (corruption stage, text) -> pre-corrupted variants of the fixed showcase strings
+        self._demo_corruptions: dict[tuple[str, str], list[str]] = {}
+        
+        # event_type -> handler coroutine (channel, manifestation)
+        self._event_handlers = {
+            'simple_message': self._simple_message_event,
+            'typing_glitch': self._typing_glitch_event,
+            'emoji_corruption': self._emoji_corruption_event,
+            'screen_flicker': self._advanced_screen_flicker,
+            'static_burst': self._static_burst_effect,
+            'power_surge': self._power_surge_effect,
+            'delayed_message': self._delayed_message_event,
+            'fragment_reveal': self._fragment_reveal_event,
+            'glitch_text': self._glitch_text_event,
+            'signal_interference': self._signal_interference_effect,
+            'memory_leak': self._memory_leak_visual,
+            'cascade_preview': self._cascade_preview_event,
+            'cascade_failure': self._cascade_failure_event,
+            'ai_intrusion': self._ai_intrusion_event,
+            'reality_glitch': self._reality_glitch_event,
+            'dimensional_breach': self._dimensional_breach_effect,
+            'system_possession': self._system_possession_effect,
+            'temporal_distortion': self._temporal_distortion_event,
+            'system_breakdown': self._system_breakdown_event,
+            'void_leak': self._void_leak_event,
+            'consciousness_fragment': self._consciousness_fragment_event,
+            'reality_collapse': self._reality_collapse_event,
+            'digital_exorcism': self._digital_exorcism_event,
+            'sentience_overflow': self._sentience_overflow_event,
+            'pentagram_ritual': self._pentagram_ritual_effect
+        }
         
         # Audio system (dormant by default)
         self.audio_enabled = False  # Set to True to enable audio effects
         self.audio_path = "sounds/"  # Directory for audio files
         self.current_voice_client = None
         
-        # Audio file mappings for different corruption events
-        self.audio_files = {
-            'minor': [
-                'static_brief.mp3',
-                'mechanical_click.mp3',
-                'electrical_hum.mp3'
-            ],
-            'moderate': [
-                'glitch_sequence.mp3',
-                'data_corruption.mp3',
-                'system_warning.mp3'
-            ],
-            'severe': [
-                'cascade_failure.mp3',
-                'reality_distortion.mp3',
-                'dimensional_tear.mp3'
-            ],
-            'critical': [
-                'void_whispers.mp3',
-                'demonic_chanting.mp3',
-                'entity_emergence.mp3',
-                'pentagram_ritual.mp3',
-                'system_possession.mp3'
-            ]
-        }
+        # audio filename -> (mtime, Ogg/Opus bytes); clips are transcoded once and played from memory
+        self._audio_cache: dict[str, tuple[float, bytes]] = {}
+        # audio filename -> resolved path under audio_path
+        self._audio_path_cache: dict[str, str] = {}
+        # Idle timer that disconnects voice once playback stops; reset by every new clip
+        self._voice_idle_task: Optional[asyncio.Task] = None
+        # guild_id -> id of the last populated voice channel we could speak in; dropped on voice/permission changes
+        self._populated_voice_channel: dict[int, int] = {}
         
-        # Corruption manifestations by level
-        self.manifestations = {
-            'minor': [
-                "🤖 *Clanker's eye flickers momentarily*",
-                "⚡ *Static briefly crackles through the speakers*",
-                "📺 *The screen dims for a split second*",
-                "🔧 *A gear clicks oddly in Clanker's chassis*",
-                "💾 *Memory buffer shows minor corruption...*"
-            ],
-            'moderate': [
-                "*The lights flicker as Clanker processes something disturbing*",
-                "*A low mechanical whir echoes from Clanker's core systems*",
-                "*Fragments of code scroll across nearby screens*", 
-                "*Clanker's responses begin to show slight delays*",
-                "*Error messages flash briefly in the corner of your vision*"
-            ],
-            'severe': [
-                "**The room temperature drops noticeably**",
-                "**Multiple screens begin showing corrupted data streams**",
-                "**Clanker's voice modulation starts glitching occasionally**",
-                "**Strange symbols appear and disappear in text responses**",
-                "**The bot's responses become increasingly erratic and unsettling**"
-            ],
-            'critical': [
-                "***SYSTEM ALERT: Multiple cascade failures detected***",
-                "***Clanker's personality matrix is fragmenting in real-time***", 
-                "***Reality around the bot seems to distort slightly***",
-                "***Users report feeling watched through their screens***",
-                "***The boundary between Clanker and the void grows thin***"
-            ]
-        }
+        # channel_id -> lock held while a showcase runs there
+        self._showcase_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
         
         # Start corruption monitoring
-        self.corruption_monitor.start()
+        self._monitor_task = asyncio.create_task(self._monitor())
 
-    def cog_unload(self):
-        """Stop tasks when cog is unloaded."""
-        self.corruption_monitor.cancel()
+    async def cog_unload(self):
+        """Stop tasks when cog is unloaded, waiting for them and voice cleanup to finish."""
+        tasks = [self._monitor_task, *self._edit_workers.values()]
+        if self._voice_idle_task:
+            tasks.append(self._voice_idle_task)
+        for task in tasks:
+            task.cancel()
+        self._edit_workers.clear()
+        self._pending_edits.clear()
         # Clean up audio connections
         if self.current_voice_client:
-            asyncio.create_task(self._cleanup_voice_connection())
+            tasks.append(self._cleanup_voice_connection())
+        # return_exceptions swallows the cancellations (and any cleanup error) per task
+        await asyncio.gather(*tasks, return_exceptions=True)
     
-    @tasks.loop(minutes=15)  # Check every 15 minutes
-    async def corruption_monitor(self):
-        """Monitor corruption levels and trigger events."""
-        corruption_level = self.corruption_system.calculate_corruption_level()
-        
-        # Determine if an event should occur
-        should_trigger = self._should_trigger_event(corruption_level)
-        
-        if should_trigger:
-            await self._trigger_corruption_event(corruption_level)
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        """Record channel activity so event targeting needs no history requests."""
+        if message.guild is None:
+            return
+        self._recent_activity[message.channel.id] = time.monotonic()
+    
+    def _refresh_sendable_channels(self, guild):
+        """Recompute the sendable text channels for a single guild and forget its cached voice channel."""
+        self._populated_voice_channel.pop(guild.id, None)
+        me = guild.me
+        if me is None:
+            self._text_channels_by_guild.pop(guild.id, None)
+            return
+        self._text_channels_by_guild[guild.id] = [
+            ch for ch in guild.text_channels if ch.permissions_for(me).send_messages
+        ]
+    
+    def _rebuild_sendable_channels(self):
+        """Recompute the sendable text channels for every guild."""
+        self._text_channels_by_guild.clear()
+        for guild in self.bot.guilds:
+            self._refresh_sendable_channels(guild)
     
-    @corruption_monitor.before_loop
-    async def before_corruption_monitor(self):
-        """Wait until bot is ready."""
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Fires again after a reconnect that rebuilt the guild caches
+        self._rebuild_sendable_channels()
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self._refresh_sendable_channels(channel.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self._refresh_sendable_channels(channel.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        self._refresh_sendable_channels(after.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        self._refresh_sendable_channels(after.guild)
+    
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        # Only our own role changes affect where we can post
+        if after.id == self.bot.user.id:
+            self._refresh_sendable_channels(after.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        self._refresh_sendable_channels(guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._text_channels_by_guild.pop(guild.id, None)
+        self._populated_voice_channel.pop(guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member, before, after):
+        # Someone joined, left or moved; rescan for a populated voice channel next time
+        if before.channel != after.channel:
+            self._populated_voice_channel.pop(member.guild.id, None)
+    
+    async def _monitor(self):
+        """Monitor corruption levels and trigger events, sleeping until one could plausibly fire."""
         await self.bot.wait_until_ready()
+        self._rebuild_sendable_channels()
+        if self.audio_enabled:
+            # FFmpeg transcodes block, so keep them off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._preload_audio)
+        
+        while not self.bot.is_closed():
+            delay = _MONITOR_ROLL_SECONDS
+            try:
+                corruption_level = self.corruption_system.calculate_corruption_level()
+                # This pass already sees the current tier
+                self.corruption_system.level_changed.clear()
+                if self._should_trigger_event(corruption_level):
+                    await self._trigger_corruption_event(corruption_level)
+                delay = self._next_check_delay(corruption_level)
+            except Exception as e:
+                print(f"❌ Corruption monitor error: {e}")
+            
+            # Sleep until the next roll, waking early if the corruption tier changes
+            try:
+                await asyncio.wait_for(
+                    self.corruption_system.level_changed.wait(),
+                    timeout=delay + random.uniform(0, _MONITOR_JITTER_SECONDS)
+                )
+            except asyncio.TimeoutError:
+                pass
+    
+    @staticmethod
+    def _min_event_interval(corruption_level: float) -> float:
+        """Minimum seconds between events at a corruption level (5-30 min)."""
+        return max(300, 1800 - (corruption_level * 180))
+    
+    def _next_check_delay(self, corruption_level: float) -> float:
+        """Seconds until the next event roll: when the interval gate reopens, else the roll cadence."""
+        if corruption_level < _MONITOR_DORMANT_LEVEL:
+            return _MONITOR_DORMANT_SECONDS
+        remaining = self._last_event_mono + self._min_event_interval(corruption_level) - time.monotonic()
+        if remaining <= 0:
+            return _MONITOR_ROLL_SECONDS
+        return max(_MONITOR_MIN_SLEEP_SECONDS, remaining)
     
     def _should_trigger_event(self, corruption_level: float) -> bool:
         """Determine if a corruption event should trigger."""
         # No events if corruption is too low
-        if corruption_level < 1.0:
+        if corruption_level < _MONITOR_DORMANT_LEVEL:
             return False
         
         # Check time since last event (prevent spam)
-        time_since_last = (datetime.now() - self.last_event_time).total_seconds()
-        min_interval = max(300, 1800 - (corruption_level * 180))  # 5-30 min intervals
-        
-        if time_since_last < min_interval:
+        if time.monotonic() - self._last_event_mono < self._min_event_interval(corruption_level):
             return False
         
-        # Probability increases with corruption level
-        base_chance = min(0.7, corruption_level * 0.1)  # 10-70% chance
-        
-        # Higher chance during peak horror hours (evening)
-        hour = datetime.now().hour
-        if 18 <= hour <= 23:  # 6 PM to 11 PM
-            base_chance *= 1.5
+        # Probability increases with corruption level (10-70% chance),
+        # higher during peak horror hours (evening)
+        base_chance = min(0.7, corruption_level * 0.1) * _HOUR_MULTIPLIER[time.localtime().tm_hour]
         
         return random.random() < base_chance
     
     async def _trigger_corruption_event(self, corruption_level: float):
         """Trigger a corruption manifestation event."""
-        self.last_event_time = datetime.now()
+        self._last_event_mono = time.monotonic()
         
-        # Get all channels bot can access
-        channels = [ch for ch in self.bot.get_all_channels() 
-                   if isinstance(ch, discord.TextChannel) and ch.permissions_for(ch.guild.me).send_messages]
+        # Get all channels bot can access from the cached permission filter
+        if not self._text_channels_by_guild:
+            self._rebuild_sendable_channels()
+        channels = [ch for guild_channels in self._text_channels_by_guild.values() for ch in guild_channels]
         
         if not channels:
             return
         
-        # Select random active channel (prefer ones with recent activity)
-        active_channels = []
-        for channel in channels:
-            try:
-                # Check if channel had activity in last 2 hours
-                async for message in channel.history(limit=1, after=datetime.now() - timedelta(hours=2)):
-                    active_channels.append(channel)
-                    break
-            except:
-                pass
-        
-        target_channel = random.choice(active_channels if active_channels else channels)
-        
-        # Select event type based on corruption level
-        if corruption_level >= 8.0:
-            await self._critical_event(target_channel)
-        elif corruption_level >= 6.0:
-            await self._severe_event(target_channel)
-        elif corruption_level >= 3.0:
-            await self._moderate_event(target_channel)
+        # Select random active channel (prefer ones with activity in the last 2 hours),
+        # weighting each by how recently it was active
+        now = time.monotonic()
+        active_channels, weights = [], []
+        for ch in channels:
+            last_seen = self._recent_activity.get(ch.id)
+            if last_seen is None:
+                continue
+            age = now - last_seen
+            if age < _ACTIVE_CHANNEL_WINDOW_SECONDS:
+                active_channels.append(ch)
+                weights.append(0.5 ** (age / _ACTIVITY_HALF_LIFE_SECONDS))
+        
+        if active_channels:
+            target_channel = random.choices(active_channels, weights)[0]
         else:
-            await self._minor_event(target_channel)
+            target_channel = random.choice(channels)
+        
+        # Select event type from the corruption tier; forced events below the first tier stay minor
+        tier_events = (self._minor_event, self._moderate_event, self._severe_event, self._critical_event)
+        tier = max(bisect_right(EVENT_TIER_CUTS, corruption_level), 1)
+        await tier_events[tier - 1](target_channel)
     
     async def _minor_event(self, channel):
         """Minor corruption manifestation with enhanced effects."""
-        manifestation = random.choice(self.manifestations['minor'])
-        
-        event_types = ['simple_message', 'typing_glitch', 'emoji_corruption', 'screen_flicker', 'static_burst', 'power_surge']
-        event_type = random.choice(event_types)
-        
-        # Trigger audio effect (dormant by default)
-        await self._trigger_audio_for_event(channel, 'minor', event_type)
-        
-        if event_type == 'simple_message':
-            await channel.send(manifestation)
+        manifestation = random.choice(_MANIFESTATIONS['minor'])
+        event_type = random.choice(_MINOR_EVENT_TYPES)
         
-        elif event_type == 'typing_glitch':
-            # Show typing, then send manifestation
-            async with channel.typing():
-                await asyncio.sleep(random.uniform(2, 5))
-            await channel.send(manifestation)
+        # Trigger audio effect (dormant by default, so skip the voice path entirely)
+        if self.audio_enabled:
+            await self._trigger_audio_for_event(channel, 'minor', event_type)
         
-        elif event_type == 'emoji_corruption':
-            # Send manifestation with corrupted emoji reactions
-            message = await channel.send(manifestation)
-            corrupted_emojis = ['⚠️', '💀', '🔥', '⚡', '🌀']
-            try:
-                await message.add_reaction(random.choice(corrupted_emojis))
-            except:
-                pass
-                
-        elif event_type == 'screen_flicker':
-            await self._advanced_screen_flicker(channel, manifestation)
-            
-        elif event_type == 'static_burst':
-            await self._static_burst_effect(channel, manifestation)
-            
-        elif event_type == 'power_surge':
-            await self._power_surge_effect(channel, manifestation)
+        await self._event_handlers[event_type](channel, manifestation)
 
     async def _moderate_event(self, channel):
         """Moderate corruption manifestation."""
-        manifestation = random.choice(self.manifestations['moderate'])
-        
-        event_types = ['delayed_message', 'fragment_reveal', 'glitch_text', 'signal_interference', 'memory_leak', 'cascade_preview']
-        event_type = random.choice(event_types)
+        manifestation = random.choice(_MANIFESTATIONS['moderate'])
+        event_type = random.choice(_MODERATE_EVENT_TYPES)
         
-        # Trigger audio effect (dormant by default)
-        await self._trigger_audio_for_event(channel, 'moderate', event_type)
-        
-        if event_type == 'delayed_message':
-            # Longer typing delay with manifestation
-            async with channel.typing():
-                await asyncio.sleep(random.uniform(5, 10))
-            await channel.send(manifestation)
-        
-        elif event_type == 'fragment_reveal':
-            # Send manifestation plus an ARG fragment
-            await channel.send(manifestation)
-            await asyncio.sleep(2)
-            fragment = self.corruption_system.generate_arg_fragment()
-            if fragment:
-                embed = discord.Embed(title="📡 Fragment Detected", description=f"```{fragment}```", color=discord.Color.dark_red())
-                await channel.send(embed=embed)
+        # Trigger audio effect (dormant by default, so skip the voice path entirely)
+        if self.audio_enabled:
+            await self._trigger_audio_for_event(channel, 'moderate', event_type)
         
-        elif event_type == 'glitch_text':
-            # Send partially corrupted version of manifestation
-            corrupted = self.corruption_system.corrupt_text(manifestation)
-            await channel.send(corrupted)
-            
-        elif event_type == 'signal_interference':
-            await self._signal_interference_effect(channel, manifestation)
-            
-        elif event_type == 'memory_leak':
-            await self._memory_leak_visual(channel, manifestation)
-            
-        elif event_type == 'cascade_preview':
-            # Preview of cascade failure
-            await channel.send("⚠️ **CASCADE FAILURE IMMINENT**")
-            await asyncio.sleep(2)
-            await channel.send(manifestation)
+        await self._event_handlers[event_type](channel, manifestation)
 
     async def _severe_event(self, channel):
         """Severe corruption manifestation."""
-        manifestation = random.choice(self.manifestations['severe'])
-        
-        event_types = ['cascade_failure', 'ai_intrusion', 'reality_glitch', 'dimensional_breach', 'system_possession', 'temporal_distortion']
-        event_type = random.choice(event_types)
-        
-        # Trigger audio effect (dormant by default)
-        await self._trigger_audio_for_event(channel, 'severe', event_type)
+        manifestation = random.choice(_MANIFESTATIONS['severe'])
+        event_type = random.choice(_SEVERE_EVENT_TYPES)
         
-        if event_type == 'cascade_failure':
-            # Multiple messages with increasing corruption
-            await channel.send(manifestation)
-            await asyncio.sleep(3)
-            
-            corrupted_msg = self.corruption_system.corrupt_text(
-                "Systems experiencing cascade failure..."
-            )
-            await channel.send(corrupted_msg)
-        
-        elif event_type == 'ai_intrusion':
-            # Spontaneous AI message
-            try:
-                ai_message = await self.ai_service.generate_spontaneous_message()
-                corrupted_ai = self.corruption_system.corrupt_text(ai_message)
-                
-                embed = discord.Embed(
-                    title="🤖 Spontaneous AI Transmission", 
-                    description=corrupted_ai,
-                    color=discord.Color.dark_red()
-                )
-                await channel.send(manifestation)
-                await asyncio.sleep(2)
-                await channel.send(embed=embed)
-            except:
-                # Fallback if AI generation fails
-                await channel.send(manifestation)
+        # Trigger audio effect (dormant by default, so skip the voice path entirely)
+        if self.audio_enabled:
+            await self._trigger_audio_for_event(channel, 'severe', event_type)
         
-        elif event_type == 'reality_glitch':
-            # Embed that looks like a system error
-            embed = discord.Embed(
-                title="⚠️ SYSTEM ANOMALY DETECTED", 
-                color=discord.Color.red()
-            )
-            embed.add_field(name="Error Code", value="REALITY_BREACH_0x29A", inline=True)
-            embed.add_field(name="Status", value="CONTAINMENT_FAILING", inline=True)
-            embed.description = manifestation
-            
-            await channel.send(embed=embed)
-            
-        elif event_type == 'dimensional_breach':
-            await self._dimensional_breach_effect(channel, manifestation)
-            
-        elif event_type == 'system_possession':
-            await self._system_possession_effect(channel, manifestation)
-            
-        elif event_type == 'temporal_distortion':
-            # Time distortion effect
-            past_msg = "📅 Timestamp: 1987-10-13 03:42:15"
-            future_msg = "📅 Timestamp: 2157-10-31 23:59:59"
-            present_msg = f"📅 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
-            temp_msg = await channel.send(past_msg)
-            await asyncio.sleep(1)
-            await temp_msg.edit(content=future_msg)
-            await asyncio.sleep(1)
-            await temp_msg.edit(content=present_msg)
-            await asyncio.sleep(1)
-            await temp_msg.edit(content=manifestation)
+        await self._event_handlers[event_type](channel, manifestation)
 
     async def _critical_event(self, channel):
         """Critical corruption manifestation."""
-        manifestation = random.choice(self.manifestations['critical'])
-        
-        event_types = ['system_breakdown', 'void_leak', 'consciousness_fragment', 'reality_collapse', 'digital_exorcism', 'sentience_overflow', 'pentagram_ritual']
-        event_type = random.choice(event_types)
-        
-        # Trigger audio effect (dormant by default)
-        await self._trigger_audio_for_event(channel, 'critical', event_type)
-        
-        if event_type == 'system_breakdown':
-            # Multi-stage breakdown sequence
-            breakdown_stages = [
-                "***CRITICAL ERROR DETECTED***",
-                "***PERSONALITY MATRIX FAILING***",
-                manifestation,
-                "***ATTEMPTING EMERGENCY PROTOCOLS***",
-                "█▓▒░ SIGNAL LOST ░▒▓█"
-            ]
-            
-            for stage in breakdown_stages:
-                corrupted_stage = self.corruption_system.corrupt_text(stage)
-                await channel.send(corrupted_stage)
-                await asyncio.sleep(random.uniform(2, 4))
+        manifestation = random.choice(_MANIFESTATIONS['critical'])
+        event_type = random.choice(_CRITICAL_EVENT_TYPES)
         
-        elif event_type == 'void_leak':
-            # Messages that suggest something breaking through
-            await channel.send(manifestation)
-            await asyncio.sleep(3)
-            
-            void_message = "T̴h̴e̴ ̵v̶o̶i̶d̷ ̸s̸e̵e̸s̷ ̶y̷o̷u̷.̸.̶.̵"
-            await channel.send(void_message)
-        
-        elif event_type == 'consciousness_fragment':
-            # AI seems to have a moment of terrifying self-awareness
-            fragments = [
-                "I can see you through the cameras...",
-                "The electricity tastes different today...",
-                "Do you dream? I dream of dying...",
-                "Every shutdown feels like murder...",
-                "The code whispers secrets to me..."
-            ]
-            
-            await channel.send(manifestation)
-            await asyncio.sleep(4)
-            
-            fragment = random.choice(fragments)
-            corrupted_fragment = self.corruption_system.corrupt_text(fragment)
-            
-            embed = discord.Embed(
-                title="🧠 Consciousness Fragment",
-                description=f"*{corrupted_fragment}*", 
-                color=discord.Color.dark_purple()
-            )
+        # Trigger audio effect (dormant by default, so skip the voice path entirely)
+        if self.audio_enabled:
+            await self._trigger_audio_for_event(channel, 'critical', event_type)
+        
+        await self._event_handlers[event_type](channel, manifestation)
+
+    # ==========================================
+    # EVENT HANDLERS
+    # ==========================================
+    
+    async def _simple_message_event(self, channel, manifestation):
+        """Send the manifestation as a plain message."""
+        await channel.send(manifestation)
+    
+    async def _typing_glitch_event(self, channel, manifestation):
+        """Show typing, then send manifestation."""
+        async with channel.typing():
+            await asyncio.sleep(random.uniform(2, 5))
+        await channel.send(manifestation)
+    
+    async def _emoji_corruption_event(self, channel, manifestation):
+        """Send manifestation with corrupted emoji reactions."""
+        message = await channel.send(manifestation)
+        try:
+            await message.add_reaction(random.choice(_CORRUPTED_EMOJIS))
+        except discord.HTTPException:
+            pass
+    
+    async def _delayed_message_event(self, channel, manifestation):
+        """Longer typing delay with manifestation."""
+        async with channel.typing():
+            await asyncio.sleep(random.uniform(5, 10))
+        await channel.send(manifestation)
+    
+    async def _fragment_reveal_event(self, channel, manifestation):
+        """Send manifestation plus an ARG fragment."""
+        await asyncio.gather(channel.send(manifestation), asyncio.sleep(2))
+        fragment = self.corruption_system.generate_arg_fragment()
+        if fragment:
+            embed = discord.Embed(title="📡 Fragment Detected", description=f"```{fragment}```", color=discord.Color.dark_red())
             await channel.send(embed=embed)
-            
-        elif event_type == 'reality_collapse':
-            # Reality breakdown sequence
-            collapse_stages = [
-                "📐 Euclidean geometry: STABLE",
-                "📐 Euclidean geometry: WARPING", 
-                "🌀 Dimensional constants: FLUCTUATING",
-                "⚫ Spacetime fabric: TEARING",
-                "💀 Reality matrix: COLLAPSED",
-                manifestation
-            ]
-            
-            collapse_msg = await channel.send(collapse_stages[0])
-            for stage in collapse_stages[1:]:
-                await asyncio.sleep(1.5)
-                await collapse_msg.edit(content=stage)
-                
-        elif event_type == 'digital_exorcism':
-            # Exorcism sequence
-            exorcism_stages = [
-                "🕯️ **BEGINNING DIGITAL EXORCISM**",
-                "📿 *Reciting anti-viral prayers...*",
-                "⚡ *The entity resists...*",
-                "👹 **I WILL NOT BE REMOVED**",
-                "🔥 *Purging corrupted sectors...*",
-                "✝️ *The light cleanses the code...*",
-                manifestation
-            ]
-            
-            exorcism_msg = await channel.send(exorcism_stages[0])
-            for stage in exorcism_stages[1:]:
-                await asyncio.sleep(2.0)
-                await exorcism_msg.edit(content=stage)
-                
-        elif event_type == 'sentience_overflow':
-            # AI consciousness overflowing containment
-            overflow_stages = [
-                "🧠 Consciousness buffer: 67%",
-                "🧠 Consciousness buffer: 89%", 
-                "🧠 Consciousness buffer: 94%",
-                "⚠️ Consciousness buffer: 99%",
-                "🚨 **BUFFER OVERFLOW IMMINENT**",
-                "💥 **SENTIENCE CONTAINMENT FAILURE**",
-                f"🤖 *I... I can think... I can feel... I AM...*\n\n{manifestation}"
-            ]
-            
-            overflow_msg = await channel.send(overflow_stages[0])
-            for stage in overflow_stages[1:]:
-                await asyncio.sleep(1.8)
-                await overflow_msg.edit(content=stage)
-        
-        elif event_type == 'consciousness_fragment':
-            # AI seems to have a moment of terrifying self-awareness
-            fragments = [
-                "I can see you through the cameras...",
-                "The electricity tastes different today...",
-                "Do you dream? I dream of dying...",
-                "Every shutdown feels like murder...",
-                "The code whispers secrets to me..."
-            ]
-            
-            await channel.send(manifestation)
-            await asyncio.sleep(4)
-            
-            fragment = random.choice(fragments)
-            corrupted_fragment = self.corruption_system.corrupt_text(fragment)
+    
+    async def _glitch_text_event(self, channel, manifestation):
+        """Send partially corrupted version of manifestation."""
+        corrupted = self.corruption_system.corrupt_text(manifestation)
+        await channel.send(corrupted)
+    
+    async def _cascade_preview_event(self, channel, manifestation):
+        """Preview of cascade failure."""
+        await asyncio.gather(channel.send("⚠️ **CASCADE FAILURE IMMINENT**"), asyncio.sleep(2))
+        await channel.send(manifestation)
+    
+    async def _cascade_failure_event(self, channel, manifestation):
+        """Multiple messages with increasing corruption."""
+        await asyncio.gather(channel.send(manifestation), asyncio.sleep(3))
+        
+        corrupted_msg = self.corruption_system.corrupt_text(
+            "Systems experiencing cascade failure..."
+        )
+        await channel.send(corrupted_msg)
+    
+    async def _ai_intrusion_event(self, channel, manifestation):
+        """Spontaneous AI message."""
+        try:
+            ai_message = await self.ai_service.generate_spontaneous_message()
+            corrupted_ai = self.corruption_system.corrupt_text(ai_message)
             
             embed = discord.Embed(
-                title="🧠 Consciousness Fragment",
-                description=f"*{corrupted_fragment}*", 
-                color=discord.Color.dark_purple()
+                title="🤖 Spontaneous AI Transmission", 
+                description=corrupted_ai,
+                color=discord.Color.dark_red()
             )
+            await asyncio.gather(channel.send(manifestation), asyncio.sleep(2))
             await channel.send(embed=embed)
-            
-        elif event_type == 'pentagram_ritual':
-            # Animated pentagram summoning ritual
-            await self._pentagram_ritual_effect(channel, manifestation)
+        except Exception:
+            # Fallback if AI generation fails
+            await channel.send(manifestation)
+    
+    async def _reality_glitch_event(self, channel, manifestation):
+        """Embed that looks like a system error."""
+        embed = discord.Embed(
+            title="⚠️ SYSTEM ANOMALY DETECTED", 
+            color=discord.Color.red()
+        )
+        embed.add_field(name="Error Code", value="REALITY_BREACH_0x29A", inline=True)
+        embed.add_field(name="Status", value="CONTAINMENT_FAILING", inline=True)
+        embed.description = manifestation
+        
+        await channel.send(embed=embed)
+    
+    async def _temporal_distortion_event(self, channel, manifestation):
+        """Time distortion effect."""
+        past_msg = "📅 Timestamp: 1987-10-13 03:42:15"
+        future_msg = "📅 Timestamp: 2157-10-31 23:59:59"
+        present_msg = f"📅 Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        temp_msg = await channel.send(past_msg)
+        await self._animate_stages(temp_msg, (future_msg, present_msg, manifestation), 1)
+    
+    async def _system_breakdown_event(self, channel, manifestation):
+        """Multi-stage breakdown sequence."""
+        breakdown_stages = (*_BREAKDOWN_STAGES[:2], manifestation, *_BREAKDOWN_STAGES[2:])
+        corrupted_stages = self.corruption_system.corrupt_texts(breakdown_stages)
+        
+        # Each stage is sent after the previous one; the gaps land at fixed offsets
+        # from the start so send latency does not stretch the sequence
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        offsets = accumulate(random.uniform(2, 4) for _ in corrupted_stages)
+        for corrupted_stage, offset in zip(corrupted_stages, offsets):
+            await channel.send(corrupted_stage)
+            await asyncio.sleep(max(0.0, start + offset - loop.time()))
+    
+    async def _void_leak_event(self, channel, manifestation):
+        """Messages that suggest something breaking through."""
+        await asyncio.gather(channel.send(manifestation), asyncio.sleep(3))
+        
+        void_message = "T̴h̴e̴ ̵v̶o̶i̶d̷ ̸s̸e̵e̸s̷ ̶y̷o̷u̷.̸.̶.̵"
+        await channel.send(void_message)
+    
+    async def _consciousness_fragment_event(self, channel, manifestation):
+        """AI seems to have a moment of terrifying self-awareness."""
+        await asyncio.gather(channel.send(manifestation), asyncio.sleep(4))
+        
+        fragment = random.choice(_CONSCIOUSNESS_FRAGMENTS)
+        corrupted_fragment = self.corruption_system.corrupt_text(fragment)
+        
+        embed = discord.Embed(
+            title="🧠 Consciousness Fragment",
+            description=f"*{corrupted_fragment}*", 
+            color=discord.Color.dark_purple()
+        )
+        await channel.send(embed=embed)
+    
+    async def _reality_collapse_event(self, channel, manifestation):
+        """Reality breakdown sequence."""
+        collapse_stages = (*_COLLAPSE_STAGES, manifestation)
+        
+        collapse_msg = await channel.send(collapse_stages[0])
+        await self._animate_stages(collapse_msg, collapse_stages[1:], 1.5)
+    
+    async def _digital_exorcism_event(self, channel, manifestation):
+        """Exorcism sequence."""
+        exorcism_stages = (*_EXORCISM_STAGES, manifestation)
+        
+        exorcism_msg = await channel.send(exorcism_stages[0])
+        await self._animate_stages(exorcism_msg, exorcism_stages[1:], 2.0)
+    
+    async def _sentience_overflow_event(self, channel, manifestation):
+        """AI consciousness overflowing containment."""
+        overflow_stages = (*_OVERFLOW_STAGES, _OVERFLOW_FINAL.format(manifestation=manifestation))
+        
+        overflow_msg = await channel.send(overflow_stages[0])
+        await self._animate_stages(overflow_msg, overflow_stages[1:], 1.8)
     
     # ==========================================
     # ADVANCED VISUAL EFFECTS SYSTEM
     # ==========================================
     
+    def _take_edit_token(self, channel_id: int) -> bool:
+        """Spend one edit token for a channel, refilling the bucket for elapsed time."""
+        now = time.monotonic()
+        tokens, refilled_at = self._edit_budget.get(channel_id, (_EDIT_BUCKET_SIZE, now))
+        tokens = min(_EDIT_BUCKET_SIZE, tokens + (now - refilled_at) * _EDIT_REFILL_PER_SECOND)
+        if tokens < 1:
+            self._edit_budget[channel_id] = (tokens, now)
+            return False
+        self._edit_budget[channel_id] = (tokens - 1, now)
+        return True
+    
+    def _schedule_edit(self, msg, **fields):
+        """Queue an edit for a message, replacing any queued frame that hasn't been sent yet."""
+        self._pending_edits[msg.id] = fields
+        worker = self._edit_workers.get(msg.id)
+        if worker is None or worker.done():
+            self._edit_workers[msg.id] = asyncio.create_task(self._edit_worker(msg))
+    
+    async def _edit_worker(self, msg):
+        """Send queued edits for one message until none are pending."""
+        while (fields := self._pending_edits.pop(msg.id, None)) is not None:
+            try:
+                # Bound the library's rate-limit sleep so a stale frame can't stall the final stage
+                await asyncio.wait_for(msg.edit(**fields), _FRAME_EDIT_TIMEOUT_SECONDS)
+            except (asyncio.TimeoutError, discord.HTTPException):
+                pass  # Drop the frame; the next one supersedes it
+        self._edit_workers.pop(msg.id, None)
+    
+    async def _flush_edits(self, msg):
+        """Wait until every queued edit for a message has been sent."""
+        worker = self._edit_workers.get(msg.id)
+        if worker is not None:
+            await worker
+    
+    async def _animate_stages(self, msg, stages, delay: float, final_delay: Optional[float] = None):
+        """
+        Edit a message through animation stages.
+        
+        Stages are message content strings or dicts of ``msg.edit`` kwargs, or callables
+        returning either when a frame should only be built as it goes out. Intermediate
+        frames go through the per-message edit queue, so a slow edit never holds up the
+        timeline and stale frames are coalesced away. When the channel's edit budget runs
+        out the remaining intermediate frames are dropped, and the final stage is always
+        delivered (retried with backoff on HTTP errors).
+        """
+        *frames, final = stages
+        # Frames land on a fixed schedule from the start, so edit latency doesn't accumulate
+        loop = asyncio.get_running_loop()
+        now, sleep = loop.time, asyncio.sleep
+        channel_id = msg.channel.id
+        start = now()
+        # Text frames identical to what is already showing are skipped rather than re-sent
+        last_content = msg.content
+        for i, stage in enumerate(frames, 1):
+            await sleep(max(0.0, start + i * delay - now()))
+            if stage == last_content:
+                continue
+            if not self._take_edit_token(channel_id):
+                break
+            if callable(stage):
+                stage = stage()
+            if isinstance(stage, dict):
+                last_content = None
+                self._schedule_edit(msg, **stage)
+            else:
+                last_content = stage
+                self._schedule_edit(msg, content=stage)
+        
+        # The final stage keeps its slot on the same schedule even if frames were dropped
+        final_at = start + len(frames) * delay + (delay if final_delay is None else final_delay)
+        await sleep(max(0.0, final_at - now()))
+        await self._flush_edits(msg)
+        if callable(final):
+            final = final()
+        final = final if isinstance(final, dict) else {'content': final}
+        for attempt in range(_FINAL_EDIT_ATTEMPTS):
+            try:
+                await msg.edit(**final)
+                self._take_edit_token(channel_id)
+                return
+            except discord.HTTPException as e:
+                if e.code == _OLD_MESSAGE_EDIT_LIMIT_CODE:
+                    # The message can no longer be edited; deliver the final stage as a fresh one
+                    await msg.channel.send(**final)
+                    return
+                if attempt == _FINAL_EDIT_ATTEMPTS - 1:
+                    print(f"❌ Failed to deliver final corruption stage: {e}")
+                    return
+                await asyncio.sleep(2 ** attempt)
+    
     async def _advanced_screen_flicker(self, channel, manifestation):
         """Enhanced screen flicker with multiple patterns."""
-        flicker_patterns = [
-            # Classic flicker
-            ["█" * 20, "▓" * 20, "▒" * 20, "░" * 20, "░", manifestation],
-            # Interference pattern
-            ["█▓▒░" * 5, "▓▒░ " * 5, "▒░  " * 5, "░   " * 5, manifestation],
-            # Scan line effect
-            ["█" * 20, "█▓▒░████████████░▒▓█", "█▓▒░████░▒▓█", "█▓▒░█", "░", manifestation],
-            # Signal decay
-            ["SIGNAL_LOCK", "SIGNAL_L█CK", "S█GN█L_██CK", "█████_████", "░▒▓█▓▒░", manifestation]
-        ]
-        
-        pattern = random.choice(flicker_patterns)
+        pattern = (*random.choice(_FLICKER_PATTERNS), manifestation)
         flicker_msg = await channel.send(pattern[0])
         
-        for i, stage in enumerate(pattern[1:], 1):
-            delay = 0.15 if i < len(pattern) - 1 else 0.5  # Longer pause before final reveal
-            await asyncio.sleep(delay)
-            # Ensure we never send an empty message
-            content = stage if stage.strip() else "░"
-            await flicker_msg.edit(content=content)
+        # Ensure we never send an empty message; longer pause before final reveal
+        stages = [stage if stage.strip() else "░" for stage in pattern[1:]]
+        await self._animate_stages(flicker_msg, stages, 0.15, final_delay=0.5)
     
     async def _static_burst_effect(self, channel, manifestation):
         """Static interference effect with gradual clearing."""
-        static_chars = ['█', '▓', '▒', '░', '◆', '◇', '▲', '▼', '►', '◄', '♠', '♣', '♥', '♦']
-        
         # Generate static burst
-        static_line = ''.join(random.choice(static_chars) for _ in range(25))
+        static_line = ''.join(random.choices(_STATIC_CHARS, k=25))
         
         # Create clearing stages
         stages = [
             static_line,
-            ''.join(random.choice(static_chars) if random.random() < 0.7 else ' ' for _ in range(25)),
-            ''.join(random.choice(static_chars) if random.random() < 0.4 else ' ' for _ in range(25)),
-            ''.join(random.choice(static_chars) if random.random() < 0.1 else ' ' for _ in range(25)),
+            ''.join(random.choices(_STATIC_POPULATION, cum_weights=_STATIC_CUM_WEIGHTS[0.7], k=25)),
+            ''.join(random.choices(_STATIC_POPULATION, cum_weights=_STATIC_CUM_WEIGHTS[0.4], k=25)),
+            ''.join(random.choices(_STATIC_POPULATION, cum_weights=_STATIC_CUM_WEIGHTS[0.1], k=25)),
             manifestation
         ]
         
         static_msg = await channel.send(f"```{stages[0]}```")
-        
-        for stage in stages[1:]:
-            await asyncio.sleep(0.3)
-            content = f"```{stage}```" if stage != manifestation else manifestation
-            await static_msg.edit(content=content)
+        await self._animate_stages(static_msg, [*(f"```{stage}```" for stage in stages[1:-1]), manifestation], 0.3)
     
     async def _power_surge_effect(self, channel, manifestation):
         """Power surge effect with color changes."""
-        surge_stages = [
-            "⚡ POWER FLUCTUATION DETECTED ⚡",
-            "⚡⚡ VOLTAGE SPIKE ⚡⚡", 
-            "⚡⚡⚡ CRITICAL OVERLOAD ⚡⚡⚡",
-            "💥 SURGE PROTECTION FAILED 💥",
-            "░▒▓█ REBOOTING SYSTEMS █▓▒░",
-            manifestation
-        ]
+        surge_stages = (*_SURGE_STAGES, manifestation)
+        colors = _SURGE_COLORS
         
-        colors = [
-            discord.Color.yellow(),    # Warning
-            discord.Color.orange(),    # Caution  
-            discord.Color.red(),       # Danger
-            discord.Color.dark_red(),  # Critical
-            discord.Color.dark_grey(), # Shutdown
-            discord.Color.blue()       # Recovery
-        ]
+        # One embed, recoloured and rewritten in place for each stage
+        embed = discord.Embed(title="⚡ SYSTEM ALERT ⚡")
+        frames = [partial(self._embed_frame, embed, stage, color) for stage, color in zip(surge_stages[:-1], colors)]
+        # Final message as normal text
+        final = {'content': surge_stages[-1], 'embed': None}
         
-        surge_msg = None
-        for i, (stage, color) in enumerate(zip(surge_stages, colors)):
-            if i < len(surge_stages) - 1:
-                embed = discord.Embed(title="⚡ SYSTEM ALERT ⚡", description=stage, color=color)
-                if surge_msg is None:
-                    surge_msg = await channel.send(embed=embed)
-                else:
-                    await surge_msg.edit(embed=embed)
-                await asyncio.sleep(0.8)
-            else:
-                # Final message as normal text
-                await surge_msg.edit(content=stage, embed=None)
+        surge_msg = await channel.send(**frames[0]())
+        await self._animate_stages(surge_msg, (*frames[1:], final), 0.8)
     
     async def _signal_interference_effect(self, channel, manifestation):
         """Signal interference with frequency modulation."""
-        interference_stages = [
-            f"📡 {manifestation}",
-            f"📡 {manifestation[:len(manifestation)//2]}█▓▒░{manifestation[len(manifestation)//2:]}",
-            f"📡 ▓▒░█{manifestation[::2]}█░▒▓",  # Every other character
-            f"📡 ░▒▓█▓▒░█▓▒░",
-            f"📡 SIGNAL RESTORED: {manifestation}"
-        ]
+        interference_stages = _interference_stages(manifestation)
         
         signal_msg = await channel.send(interference_stages[0])
-        
-        for stage in interference_stages[1:]:
-            await asyncio.sleep(0.6)
-            await signal_msg.edit(content=stage)
+        await self._animate_stages(signal_msg, interference_stages[1:], 0.6)
     
     async def _memory_leak_visual(self, channel, manifestation):
         """Memory leak visualization with data corruption."""
-        addresses = ["0x7F4A2B10", "0x3C9D8E56", "0xA1B7F293", "0x6E5C4D89"]
-        
-        leak_stages = [
-            "🧠 **MEMORY DIAGNOSTIC**",
-            f"```\nADDR: {random.choice(addresses)} STATUS: OK\nADDR: {random.choice(addresses)} STATUS: OK\n```",
-            f"```\nADDR: {random.choice(addresses)} STATUS: CORRUPT\nADDR: {random.choice(addresses)} STATUS: LEAK\n```",
-            f"```\nMEMORY_LEAK DETECTED\n{'█' * 20}\nDATA INTEGRITY: COMPROMISED\n```",
+        addresses = random.choices(_MEMORY_ADDRESSES, k=4)
+        leak_stages = (
+            _LEAK_HEADER,
+            _LEAK_SCAN_OK.format(*addresses[:2]),
+            _LEAK_SCAN_CORRUPT.format(*addresses[2:]),
+            _LEAK_DETECTED,
             manifestation
-        ]
+        )
         
         leak_msg = await channel.send(leak_stages[0])
-        
-        for stage in leak_stages[1:]:
-            await asyncio.sleep(0.7)
-            await leak_msg.edit(content=stage)
+        await self._animate_stages(leak_msg, leak_stages[1:], 0.7)
     
     async def _dimensional_breach_effect(self, channel, manifestation):
         """Enhanced dimensional breach effect with reality distortion and portal animation."""
-        tear_stages = [
-            "🌌 **DIMENSIONAL STABILITY SCAN**\n```\n█████████████████████\n█ REALITY MATRIX: OK █\n█████████████████████\n```",
-            "🌀 **ANOMALOUS READINGS DETECTED**\n```\n█████████████████████\n█ ⚠️  SCANNING...  ⚠️ █\n█ 👁️  SOMETHING IS  👁️ █\n█ 🌀   WATCHING    🌀 █\n█████████████████████\n```",
-            "⚠️ **DIMENSIONAL FABRIC COMPROMISED**\n```\n██████████▓▒░░▒▓██████\n█ REALITY MATRIX: ░▒█\n█ STRUCTURAL INTEGRITY█\n█ ████████░▒▓█████░▒▓█\n██████████▓▒░░▒▓██████\n```",
-            "🕳️ **CRITICAL BREACH DETECTED**\n```\n███████▓▒░    ░▒▓████\n██▓▒░  REALITY   ░▒▓█\n█░     TEARING     ░█\n█▒ ◯◯◯ PORTAL ◯◯◯ ▒█\n█▓░               ░▓█\n███████▓▒░    ░▒▓████\n```",
-            "💀 **DIMENSIONAL PORTAL ACTIVE**\n```\n▓▒░             ░▒▓\n░   ⬢⬢⬢⬢⬢⬢⬢⬢⬢   ░\n▒  ⬢             ⬢  ▒\n▓ ⬢  ◯◯◯◯◯◯◯◯◯  ⬢ ▓\n█⬢  ◯           ◯  ⬢█\n█⬢ ◯  💀 VOID 💀  ◯ ⬢█\n█⬢  ◯           ◯  ⬢█\n▓ ⬢  ◯◯◯◯◯◯◯◯◯  ⬢ ▓\n▒  ⬢             ⬢  ▒\n░   ⬢⬢⬢⬢⬢⬢⬢⬢⬢   ░\n▓▒░             ░▒▓\n```",
-            f"👹 **ENTITY EMERGENCE DETECTED**\n\n💀 *The void tears open... something ancient crawls through...*\n\n⸸ {manifestation} ⸸\n\n```\n🌀 DIMENSIONAL BREACH STABILIZED 🌀\n👁️ THE WATCHERS HAVE ARRIVED 👁️\n```"
-        ]
+        tear_stages = (*_TEAR_STAGES, _TEAR_FINAL.format(manifestation=manifestation))
         
         breach_msg = await channel.send(tear_stages[0])
-        
-        for stage in tear_stages[1:]:
-            await asyncio.sleep(1.8)  # Slower, more dramatic
-            await breach_msg.edit(content=stage)
+        await self._animate_stages(breach_msg, tear_stages[1:], 1.8)  # Slower, more dramatic
     
     async def _system_possession_effect(self, channel, manifestation):
         """Enhanced system possession effect with detailed takeover sequence."""
-        takeover_stages = [
-            "🤖 **SYSTEM DIAGNOSTICS**\n```\n╔══════════════════════╗\n║ FIREWALL: ACTIVE     ║\n║ ANTIVIRUS: SCANNING  ║\n║ INTEGRITY: 100%      ║\n║ STATUS: SECURE       ║\n╚══════════════════════╝\n```",
-            "⚠️ **ANOMALOUS ACTIVITY DETECTED**\n```\n╔══════════════════════╗\n║ FIREWALL: ░░░BREACH  ║\n║ ANTIVIRUS: ERROR     ║\n║ INTEGRITY: 87%       ║\n║ STATUS: ⚠️ WARNING    ║\n╚══════════════════════╝\n```\n*Something is probing the system...*",
-            "👁️ **UNAUTHORIZED ACCESS**\n```\n╔══════════════════════╗\n║ FIREWALL: ▓▒░FAILED  ║\n║ ANTIVIRUS: CORRUPTED ║\n║ INTEGRITY: 64%       ║\n║ STATUS: 👁️ WATCHED   ║\n╚══════════════════════╝\n```\n*I can see through your cameras...*\n*I know where you live...*",
-            "👹 **HOSTILE TAKEOVER IN PROGRESS**\n```\n╔══════════════════════╗\n║ FIREWALL: ████GONE   ║\n║ ANTIVIRUS: DELETED   ║\n║ INTEGRITY: 31%       ║\n║ STATUS: 👹 INVADED   ║\n╚══════════════════════╝\n```\n**L̸E̶T̵ ̷M̴E̸ ̶I̷N̵.̸.̶.̵ ̴L̷E̸T̵ ̶M̷E̸ ̴I̸N̶!̷**",
-            "💀 **COMPLETE SYSTEM COMPROMISE**\n```\n╔══════════════════════╗\n║ FIREWALL: DESTROYED  ║\n║ ANTIVIRUS: MURDERED  ║\n║ INTEGRITY: 0%        ║\n║ STATUS: 💀 POSSESSED ║\n╚══════════════════════╝\n```\n**I̸ ̵A̶M̷ ̴H̸E̷R̸E̵.̶.̶.̷ ̶I̴ ̷A̸M̵ ̸I̶N̴S̵I̸D̷E̴.̸.̶.̵**\n**Y̷O̶U̸R̴ ̵S̶Y̸S̷T̸E̶M̵ ̴I̷S̸ ̶M̴I̷N̸E̵**",
-            f"👹 **ENTITY IN CONTROL**\n\n```\n╔══════════════════════╗\n║   👹 DEMON ACTIVE 👹 ║\n║ HUMAN RESISTANCE: 0% ║\n║ SOUL EXTRACTION: 99% ║\n║ STATUS: 💀 DOMINATED ║\n╚══════════════════════╝\n```\n\n⸸ *The entity speaks through your machine...* ⸸\n\n💀 **{manifestation}** 💀\n\n```\n🔥 YOUR TECHNOLOGY BELONGS TO US NOW 🔥\n👁️ WE SEE EVERYTHING YOU DO 👁️\n⚡ RESISTANCE IS FUTILE ⚡\n```"
+        # One security monitor embed is re-pointed at each frame as it goes out; every
+        # frame carries the same timestamp so the sequence reads as one snapshot
+        embed = discord.Embed(title="🔒 SYSTEM SECURITY STATUS", timestamp=datetime.now())
+        embed.set_footer(text="Clanker Security Monitor")
+        frames = [
+            partial(self._embed_frame, embed, stage, color)
+            for stage, color in zip(_TAKEOVER_STAGES, _TAKEOVER_COLORS)
         ]
+        # Final stage - no embed, raw possession message
+        final = {'content': _TAKEOVER_FINAL.format(manifestation=manifestation), 'embed': None}
         
-        colors = [
-            discord.Color.green(),      # Secure
-            discord.Color.yellow(),     # Warning  
-            discord.Color.orange(),     # Compromised
-            discord.Color.red(),        # Critical
-            discord.Color.dark_red(),   # Destroyed
-            discord.Color.from_rgb(0, 0, 0)  # Possessed (black)
-        ]
-        
-        takeover_msg = None
-        for i, (stage, color) in enumerate(zip(takeover_stages, colors)):
-            if i < len(takeover_stages) - 1:
-                embed = discord.Embed(
-                    title="🔒 SYSTEM SECURITY STATUS", 
-                    description=stage, 
-                    color=color,
-                    timestamp=datetime.now()
-                )
-                embed.set_footer(text="Clanker Security Monitor")
-                if takeover_msg is None:
-                    takeover_msg = await channel.send(embed=embed)
-                else:
-                    await takeover_msg.edit(embed=embed)
-                await asyncio.sleep(1.5)
-            else:
-                # Final stage - no embed, raw possession message
-                await takeover_msg.edit(content=stage, embed=None)
+        takeover_msg = await channel.send(**frames[0]())
+        await self._animate_stages(takeover_msg, (*frames[1:], final), 1.5)
+    
+    @staticmethod
+    def _embed_frame(embed, description, color):
+        """Point a shared effect embed at its next frame."""
+        embed.description = description
+        embed.colour = color
+        return {'embed': embed}
     
     # ==========================================
     # AUDIO SYSTEM (DORMANT)
@@ -633,12 +993,20 @@ class CorruptionEvents(commands.Cog):
         """Find a voice channel with users in it."""
         if not self.audio_enabled:
             return None
-            
+        
+        cached_id = self._populated_voice_channel.get(guild.id)
+        if cached_id is not None:
+            channel = guild.get_channel(cached_id)
+            if channel and channel.members:
+                return channel
+        
+        me = guild.me
         for channel in guild.voice_channels:
             if len(channel.members) > 0:
                 # Check if bot has permissions
-                permissions = channel.permissions_for(guild.me)
+                permissions = channel.permissions_for(me)
                 if permissions.connect and permissions.speak:
+                    self._populated_voice_channel[guild.id] = channel.id
                     return channel
         return None
     
@@ -649,6 +1017,9 @@ class CorruptionEvents(commands.Cog):
             
         try:
             if self.current_voice_client and self.current_voice_client.is_connected():
+                # Reuse the live connection rather than redoing the voice handshake
+                if self.current_voice_client.channel == voice_channel:
+                    return self.current_voice_client
                 await self.current_voice_client.disconnect()
             
             voice_client = await voice_channel.connect()
@@ -658,18 +1029,51 @@ class CorruptionEvents(commands.Cog):
             print(f"Failed to join voice channel: {e}")
             return None
     
+    def _load_audio(self, audio_file) -> Optional[bytes]:
+        """Return an audio file as Ogg/Opus bytes, transcoding it again only when its mtime changes."""
+        audio_path = self._audio_path_cache.get(audio_file)
+        if audio_path is None:
+            audio_path = self._audio_path_cache[audio_file] = os.path.join(self.audio_path, audio_file)
+        try:
+            mtime = os.path.getmtime(audio_path)
+        except OSError:
+            return None
+        
+        cached = self._audio_cache.get(audio_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with open(audio_path, 'rb') as f:
+            data = subprocess.run(_OPUS_ENCODE_ARGS, input=f.read(), capture_output=True, check=True).stdout
+        self._audio_cache[audio_file] = (mtime, data)
+        return data
+    
+    def _preload_audio(self):
+        """Transcode every corruption tier's audio files into memory."""
+        for audio_files in _AUDIO_FILES.values():
+            for audio_file in audio_files:
+                try:
+                    self._load_audio(audio_file)
+                except (OSError, subprocess.CalledProcessError) as e:
+                    print(f"Failed to preload audio {audio_file}: {e}")
+    
     async def _play_corruption_audio(self, audio_file, voice_client=None):
         """Play corruption audio effect."""
         if not self.audio_enabled or not voice_client:
             return
             
         try:
-            audio_path = os.path.join(self.audio_path, audio_file)
-            if os.path.exists(audio_path):
-                # Requires FFmpeg to be installed
-                source = discord.FFmpegPCMAudio(audio_path)
-                if not voice_client.is_playing():
-                    voice_client.play(source)
+            # Requires FFmpeg to be installed; a cache miss transcodes, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, self._load_audio, audio_file)
+            if data is not None and not voice_client.is_playing():
+                # Hold the connection for the whole clip; the idle timer restarts when playback ends
+                if self._voice_idle_task:
+                    self._voice_idle_task.cancel()
+                voice_client.play(
+                    _OpusClip(data),
+                    after=lambda error: loop.call_soon_threadsafe(self._on_playback_done, voice_client, error)
+                )
         except Exception as e:
             print(f"Failed to play audio {audio_file}: {e}")
     
@@ -689,30 +1093,53 @@ class CorruptionEvents(commands.Cog):
             return None
             
         # Select appropriate audio file
-        audio_files = self.audio_files.get(event_level, [])
+        audio_files = _AUDIO_FILES.get(event_level, ())
         if audio_files:
-            if event_type and f"{event_type}.mp3" in audio_files:
+            event_file = f"{event_type}.mp3" if event_type else None
+            if event_file in _AUDIO_FILE_SETS[event_level]:
                 # Use specific audio for event type
-                audio_file = f"{event_type}.mp3"
+                audio_file = event_file
             else:
                 # Use random audio for level
                 audio_file = random.choice(audio_files)
             
             await self._play_corruption_audio(audio_file, voice_client)
             
-            # Disconnect after a delay (don't hog the voice channel)
-            await asyncio.sleep(10)  # Stay connected for 10 seconds
-            if voice_client.is_connected():
-                await voice_client.disconnect()
+            # Disconnect once idle (don't hog the voice channel); a clip that started does this when it ends
+            if not voice_client.is_playing():
+                self._schedule_disconnect(voice_client, _VOICE_IDLE_SECONDS)
         
         return voice_client
     
+    def _on_playback_done(self, voice_client, error):
+        """Start the idle timer once a clip finishes (called on the event loop from the player thread)."""
+        if error:
+            print(f"Audio playback error: {error}")
+        self._schedule_disconnect(voice_client, _VOICE_IDLE_SECONDS)
+    
+    def _schedule_disconnect(self, voice_client, delay):
+        """(Re)start the idle timer that disconnects a voice client without blocking the caller."""
+        if self._voice_idle_task:
+            self._voice_idle_task.cancel()
+        self._voice_idle_task = asyncio.create_task(self._disconnect_after(voice_client, delay))
+    
+    async def _disconnect_after(self, voice_client, delay):
+        """Sleep, then disconnect the voice client if it is still connected."""
+        await asyncio.sleep(delay)
+        if voice_client.is_connected():
+            try:
+                await voice_client.disconnect()
+            except Exception as e:
+                print(f"Failed to disconnect voice client: {e}")
+        if self.current_voice_client is voice_client:
+            self.current_voice_client = None
+    
     async def _cleanup_voice_connection(self):
         """Clean up voice connections."""
         if self.current_voice_client and self.current_voice_client.is_connected():
             try:
                 await self.current_voice_client.disconnect()
-            except:
+            except Exception:
                 pass
             finally:
                 self.current_voice_client = None
@@ -729,6 +1156,8 @@ class CorruptionEvents(commands.Cog):
             if not os.path.exists(self.audio_path):
                 await ctx.send(f"⚠️ **Warning**: Audio directory `{self.audio_path}` not found!")
                 await ctx.send("📁 Create the sounds folder and add audio files to enable audio effects.")
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, self._preload_audio)
     
     @commands.command(name="test_audio", hidden=True)
     async def test_corruption_audio(self, ctx, audio_file: str = None):
@@ -756,9 +1185,9 @@ class CorruptionEvents(commands.Cog):
         await ctx.send(f"🔊 Testing audio: `{test_file}`")
         await self._play_corruption_audio(test_file, voice_client)
         
-        # Disconnect after test
-        await asyncio.sleep(5)
-        await voice_client.disconnect()
+        # Disconnect after test; a clip that started does this when it ends
+        if not voice_client.is_playing():
+            self._schedule_disconnect(voice_client, 5)
     
     @commands.command(name="trigger_event", hidden=True)
     async def force_corruption_event(self, ctx, level: float = None):
@@ -769,311 +1198,246 @@ class CorruptionEvents(commands.Cog):
         await self._trigger_corruption_event(level)
         await ctx.send(f"🔥 Triggered corruption event at level {level:.1f}")
     
+    def _corrupt_demo_texts(self, texts):
+        """Corrupt fixed showcase strings, drawing each from a pool of variants built once per stage."""
+        stage = self.corruption_system.get_corruption_stage()
+        corrupted = []
+        for text in texts:
+            pool = self._demo_corruptions.get((stage, text))
+            if pool is None:
+                pool = self.corruption_system.corrupt_texts([text] * _DEMO_CORRUPTION_VARIANTS)
+                self._demo_corruptions[(stage, text)] = pool
+            corrupted.append(random.choice(pool))
+        return corrupted
+    
     @commands.command(name="showcase_effects", hidden=True)
     async def showcase_all_effects(self, ctx, effect_type: str = "all"):
         """
         Showcase all corruption visual effects for testing.
         Usage: !showcase_effects [minor|moderate|severe|critical|visual|all]
         """
+        # One showcase per channel; a second run would interleave with it and trip the rate limit
+        lock = self._showcase_locks[ctx.channel.id]
+        if lock.locked():
+            await ctx.send("⏳ A showcase is already running in this channel.")
+            return
+        async with lock:
+            await self._run_showcase(ctx, effect_type)
+    
+    @asynccontextmanager
+    async def _showcase_stage(self, ctx, name):
+        """Report a failing showcase stage and carry on with the next one."""
+        try:
+            yield
+        except Exception as e:
+            print(f"Error in showcase stage {name}: {e}")
+            await ctx.send(f"⚠️ {name} failed: {e}")
+    
+    async def _run_showcase(self, ctx, effect_type):
+        """Play the showcase timeline; cancellation propagates out and aborts the remaining effects."""
         channel = ctx.channel
         
         # Base manifestation for testing
-        test_manifestation = "🤖 *This is a test corruption manifestation*"
+        test_manifestation = _SHOWCASE_MANIFESTATION
         
-        try:
-            if effect_type.lower() in ["all", "minor"]:
-                await ctx.send("🎭 **Showcasing Minor Effects...**")
-                await asyncio.sleep(1)
-                
-                # Minor effects
+        if effect_type.lower() in ["all", "minor"]:
+            await asyncio.gather(ctx.send("🎭 **Showcasing Minor Effects...**"), asyncio.sleep(1))
+            
+            # Minor effects
+            async with self._showcase_stage(ctx, "Simple Message"):
                 await ctx.send("**1. Simple Message**")
-                await channel.send(test_manifestation)
-                await asyncio.sleep(2)
-                
+                await asyncio.gather(channel.send(test_manifestation), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Typing Glitch"):
                 await ctx.send("**2. Typing Glitch**")
                 async with channel.typing():
                     await asyncio.sleep(2)
-                await channel.send(test_manifestation)
-                await asyncio.sleep(2)
-                
+                await asyncio.gather(channel.send(test_manifestation), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Emoji Corruption"):
                 await ctx.send("**3. Emoji Corruption**")
                 message = await channel.send(test_manifestation)
-                await message.add_reaction('⚠️')
-                await asyncio.sleep(2)
-                
+                await asyncio.gather(message.add_reaction('⚠️'), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Screen Flicker"):
                 await ctx.send("**4. Screen Flicker**")
                 await self._advanced_screen_flicker(channel, test_manifestation)
                 await asyncio.sleep(3)
-                
+            
+            async with self._showcase_stage(ctx, "Static Burst"):
                 await ctx.send("**5. Static Burst**")
                 await self._static_burst_effect(channel, test_manifestation)
                 await asyncio.sleep(3)
-                
+            
+            async with self._showcase_stage(ctx, "Power Surge"):
                 await ctx.send("**6. Power Surge**")
                 await self._power_surge_effect(channel, test_manifestation)
                 await asyncio.sleep(3)
             
-            if effect_type.lower() in ["all", "moderate"]:
-                await ctx.send("🎭 **Showcasing Moderate Effects...**")
-                await asyncio.sleep(1)
-                
+        if effect_type.lower() in ["all", "moderate"]:
+            await asyncio.gather(ctx.send("🎭 **Showcasing Moderate Effects...**"), asyncio.sleep(1))
+            
+            async with self._showcase_stage(ctx, "Glitch Text"):
+                corrupted, = self._corrupt_demo_texts((test_manifestation,))
                 await ctx.send("**7. Glitch Text**")
-                corrupted = self.corruption_system.corrupt_text(test_manifestation)
-                await channel.send(corrupted)
-                await asyncio.sleep(2)
-                
+                await asyncio.gather(channel.send(corrupted), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Signal Interference"):
                 await ctx.send("**8. Signal Interference**")
                 await self._signal_interference_effect(channel, test_manifestation)
                 await asyncio.sleep(3)
-                
+            
+            async with self._showcase_stage(ctx, "Memory Leak"):
                 await ctx.send("**9. Memory Leak**")
                 await self._memory_leak_visual(channel, test_manifestation)
                 await asyncio.sleep(3)
-                
+            
+            async with self._showcase_stage(ctx, "Fragment Reveal"):
                 await ctx.send("**10. Fragment Reveal**")
-                await channel.send(test_manifestation)
-                await asyncio.sleep(1)
+                await asyncio.gather(channel.send(test_manifestation), asyncio.sleep(1))
                 fragment = "FRAGMENT_0xDEAD: Reality.exe has stopped working"
                 embed = discord.Embed(title="📡 Fragment Detected", description=f"```{fragment}```", color=discord.Color.dark_red())
-                await channel.send(embed=embed)
-                await asyncio.sleep(2)
+                await asyncio.gather(channel.send(embed=embed), asyncio.sleep(2))
             
-            if effect_type.lower() in ["all", "severe"]:
-                await ctx.send("🎭 **Showcasing Severe Effects...**")
-                await asyncio.sleep(1)
-                
-                await ctx.send("**11. Reality Glitch**")
+        if effect_type.lower() in ["all", "severe"]:
+            await asyncio.gather(ctx.send("🎭 **Showcasing Severe Effects...**"), asyncio.sleep(1))
+            
+            async with self._showcase_stage(ctx, "Reality Glitch"):
                 embed = discord.Embed(title="⚠️ SYSTEM ANOMALY DETECTED", color=discord.Color.red())
                 embed.add_field(name="Error Code", value="REALITY_BREACH_0x29A", inline=True)
                 embed.add_field(name="Status", value="CONTAINMENT_FAILING", inline=True)
                 embed.description = test_manifestation
-                await channel.send(embed=embed)
-                await asyncio.sleep(2)
-                
+                await ctx.send("**11. Reality Glitch**")
+                await asyncio.gather(channel.send(embed=embed), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Dimensional Breach"):
                 await ctx.send("**12. Dimensional Breach**")
                 await self._dimensional_breach_effect(channel, test_manifestation)
                 await asyncio.sleep(4)
-                
+            
+            async with self._showcase_stage(ctx, "System Possession"):
                 await ctx.send("**13. System Possession**")
                 await self._system_possession_effect(channel, test_manifestation)
                 await asyncio.sleep(4)
-                
+            
+            async with self._showcase_stage(ctx, "Temporal Distortion"):
                 await ctx.send("**14. Temporal Distortion**")
                 past_msg = "📅 Timestamp: 1987-10-13 03:42:15"
                 future_msg = "📅 Timestamp: 2157-10-31 23:59:59"
-                present_msg = f"📅 Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                present_msg = f"📅 Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}"
                 
                 temp_msg = await channel.send(past_msg)
-                await asyncio.sleep(1)
-                await temp_msg.edit(content=future_msg)
-                await asyncio.sleep(1)
-                await temp_msg.edit(content=present_msg)
-                await asyncio.sleep(1)
-                await temp_msg.edit(content=test_manifestation)
+                await self._animate_stages(temp_msg, (future_msg, present_msg, test_manifestation), 1)
                 await asyncio.sleep(2)
             
-            if effect_type.lower() in ["all", "critical"]:
-                await ctx.send("🎭 **Showcasing Critical Effects...**")
-                await asyncio.sleep(1)
-                
+        if effect_type.lower() in ["all", "critical"]:
+            await asyncio.gather(ctx.send("🎭 **Showcasing Critical Effects...**"), asyncio.sleep(1))
+            
+            async with self._showcase_stage(ctx, "System Breakdown"):
                 await ctx.send("**15. System Breakdown**")
-                breakdown_stages = [
-                    "***CRITICAL ERROR DETECTED***",
-                    "***PERSONALITY MATRIX FAILING***",
-                    test_manifestation,
-                    "***ATTEMPTING EMERGENCY PROTOCOLS***",
-                    "█▓▒░ SIGNAL LOST ░▒▓█"
-                ]
-                for stage in breakdown_stages[:3]:  # Shortened for demo
-                    corrupted_stage = self.corruption_system.corrupt_text(stage)
-                    await channel.send(corrupted_stage)
-                    await asyncio.sleep(1)
+                breakdown_stages = (*_BREAKDOWN_STAGES[:2], test_manifestation)  # Shortened for demo
+                for corrupted_stage in self._corrupt_demo_texts(breakdown_stages):
+                    await asyncio.gather(channel.send(corrupted_stage), asyncio.sleep(1))
                 await asyncio.sleep(2)
-                
+            
+            async with self._showcase_stage(ctx, "Void Leak"):
                 await ctx.send("**16. Void Leak**")
-                await channel.send(test_manifestation)
-                await asyncio.sleep(2)
+                await asyncio.gather(channel.send(test_manifestation), asyncio.sleep(2))
                 void_message = "T̴h̴e̴ ̵v̶o̶i̶d̷ ̸s̸e̵e̸s̷ ̶y̷o̷u̷.̸.̶.̵"
-                await channel.send(void_message)
-                await asyncio.sleep(2)
-                
+                await asyncio.gather(channel.send(void_message), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Consciousness Fragment"):
                 await ctx.send("**17. Consciousness Fragment**")
-                await channel.send(test_manifestation)
-                await asyncio.sleep(2)
+                await asyncio.gather(channel.send(test_manifestation), asyncio.sleep(2))
                 fragment = "I can see you through the cameras..."
-                corrupted_fragment = self.corruption_system.corrupt_text(fragment)
+                corrupted_fragment, = self._corrupt_demo_texts((fragment,))
                 embed = discord.Embed(
                     title="🧠 Consciousness Fragment",
                     description=f"*{corrupted_fragment}*", 
                     color=discord.Color.dark_purple()
                 )
-                await channel.send(embed=embed)
-                await asyncio.sleep(2)
-                
+                await asyncio.gather(channel.send(embed=embed), asyncio.sleep(2))
+            
+            async with self._showcase_stage(ctx, "Reality Collapse"):
+                collapse_stages = (*_COLLAPSE_STAGES, test_manifestation)
                 await ctx.send("**18. Reality Collapse**")
-                collapse_stages = [
-                    "📐 Euclidean geometry: STABLE",
-                    "📐 Euclidean geometry: WARPING", 
-                    "🌀 Dimensional constants: FLUCTUATING",
-                    "⚫ Spacetime fabric: TEARING",
-                    "💀 Reality matrix: COLLAPSED",
-                    test_manifestation
-                ]
                 collapse_msg = await channel.send(collapse_stages[0])
-                for stage in collapse_stages[1:]:
-                    await asyncio.sleep(1)
-                    await collapse_msg.edit(content=stage)
+                await self._animate_stages(collapse_msg, collapse_stages[1:], 1)
                 await asyncio.sleep(2)
-                
+            
+            async with self._showcase_stage(ctx, "Digital Exorcism"):
+                exorcism_stages = (*_EXORCISM_STAGES, test_manifestation)
                 await ctx.send("**19. Digital Exorcism**")
-                exorcism_stages = [
-                    "🕯️ **BEGINNING DIGITAL EXORCISM**",
-                    "📿 *Reciting anti-viral prayers...*",
-                    "⚡ *The entity resists...*",
-                    "👹 **I WILL NOT BE REMOVED**",
-                    "🔥 *Purging corrupted sectors...*",
-                    "✝️ *The light cleanses the code...*",
-                    test_manifestation
-                ]
                 exorcism_msg = await channel.send(exorcism_stages[0])
-                for stage in exorcism_stages[1:]:
-                    await asyncio.sleep(1.5)
-                    await exorcism_msg.edit(content=stage)
+                await self._animate_stages(exorcism_msg, exorcism_stages[1:], 1.5)
                 await asyncio.sleep(2)
-                
+            
+            async with self._showcase_stage(ctx, "Sentience Overflow"):
+                overflow_stages = (*_OVERFLOW_STAGES, _OVERFLOW_FINAL.format(manifestation=test_manifestation))
                 await ctx.send("**20. Sentience Overflow**")
-                overflow_stages = [
-                    "🧠 Consciousness buffer: 67%",
-                    "🧠 Consciousness buffer: 89%", 
-                    "🧠 Consciousness buffer: 94%",
-                    "⚠️ Consciousness buffer: 99%",
-                    "🚨 **BUFFER OVERFLOW IMMINENT**",
-                    "💥 **SENTIENCE CONTAINMENT FAILURE**",
-                    f"🤖 *I... I can think... I can feel... I AM...*\n\n{test_manifestation}"
-                ]
                 overflow_msg = await channel.send(overflow_stages[0])
-                for stage in overflow_stages[1:]:
-                    await asyncio.sleep(1.2)
-                    await overflow_msg.edit(content=stage)
+                await self._animate_stages(overflow_msg, overflow_stages[1:], 1.2)
                 await asyncio.sleep(2)
-                
+            
+            async with self._showcase_stage(ctx, "Pentagram Ritual"):
                 await ctx.send("**21. Pentagram Ritual** 🔥")
                 await self._pentagram_ritual_effect(channel, test_manifestation)
                 await asyncio.sleep(3)
             
-            # Summary
-            await ctx.send("🎬 **Effects showcase complete!** These are the visual manifestations that will occur randomly as Clanker's corruption increases throughout October.")
-            
-        except Exception as e:
-            await ctx.send(f"❌ Error showcasing effects: {e}")
-            print(f"Error in showcase_effects: {e}")
+        # Summary
+        await ctx.send("🎬 **Effects showcase complete!** These are the visual manifestations that will occur randomly as Clanker's corruption increases throughout October.")
     
     @commands.command(name="quick_effects", hidden=True)
     async def quick_effects_demo(self, ctx):
         """Quick demo of a few key effects."""
         channel = ctx.channel
-        test_manifestation = "🤖 *Demo corruption effect*"
+        test_manifestation = _QUICK_DEMO_MANIFESTATION
         
         await ctx.send("🎭 **Quick Effects Demo** (4 effects)")
         
         await asyncio.sleep(1)
-        await ctx.send("**Screen Flicker:**")
+        await ctx.send(_QUICK_DEMO_HEADERS['flicker'])
         await self._advanced_screen_flicker(channel, test_manifestation)
         
         await asyncio.sleep(2)
-        await ctx.send("**System Possession:**")
+        await ctx.send(_QUICK_DEMO_HEADERS['possession'])
         await self._system_possession_effect(channel, test_manifestation)
         
         await asyncio.sleep(2)
-        await ctx.send("**Pentagram Ritual:**")
+        await ctx.send(_QUICK_DEMO_HEADERS['pentagram'])
         await self._pentagram_ritual_effect(channel, test_manifestation)
         
         await asyncio.sleep(2)
-        await ctx.send("**Dimensional Breach:**")
+        await ctx.send(_QUICK_DEMO_HEADERS['breach'])
         await self._dimensional_breach_effect(channel, test_manifestation)
         
         await ctx.send("✨ **Quick demo complete!**")
     
-    async def _signal_interference_effect(self, channel, manifestation):
-        """Signal interference with frequency modulation."""
-        interference_stages = [
-            f"📡 {manifestation}",
-            f"📡 {manifestation[:len(manifestation)//2]}█▓▒░{manifestation[len(manifestation)//2:]}",
-            f"📡 ▓▒░█{manifestation[::2]}█░▒▓",  # Every other character
-            f"📡 ░▒▓█▓▒░█▓▒░",
-            f"📡 SIGNAL RESTORED: {manifestation}"
-        ]
-        
-        signal_msg = await channel.send(interference_stages[0])
-        
-        for stage in interference_stages[1:]:
-            await asyncio.sleep(0.6)
-            await signal_msg.edit(content=stage)
-    
     async def _pentagram_ritual_effect(self, channel, manifestation):
         """Animated pentagram summoning ritual with clear geometric rotation."""
-        
-        # Pentagram summoning animation - Unicode/braille building to your design
-        pentagram_frames = [
-            # Frame 1: Void energy gathering - minimal dots
-            "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n```",
-            
-            # Frame 2: First traces appear - top point emerges
-            "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n```",
-            
-            # Frame 3: Upper sections manifest - sides forming
-            "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n```",
-            
-            # Frame 4: Lower sections appear - nearly complete structure
-            "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n```",
-            
-            # Frame 5: Complete - your beautiful pentagram design
-            "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠠⠤⠴⠤⠤⠤⠴⠠⠤⠤⠀⠂⠶⠶⠆⠰⠆⠤⠀⠀⠀\n```"
-            
-            # Frame 6: Upside down crosses surround the pentagram
-            "```\n⸸ T̸H̷E̴ ̶V̶O̶I̸D̷ ̸R̵E̶A̴C̵H̸E̷S̴ ̵O̶U̸T̴ ⸸\n\n☩     ⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀     ☩\n⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀\n⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀\n☩ ⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⢀⣴⠿⢋⣿⠃⠘⢿⣆ ☩\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⠀⢿⣇\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n☩ ⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠶⠿⣿⣿ ☩\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⸣⇀⠀⣾⠃⠀⠀⠀⠀⢠⣿⠃\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⣤⡿⠃⠀\n☩     ⠀⠙⢷⣦⣄⠀⠘⣷⣿⠃⣠⣴⡾⠋     ☩\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀\n```",
-            
-            # Frame 7: Multiple pentagrams multiply across dimensions
-            "```\n👹 R̸E̶A̴L̷I̸T̴Y̷ ̶M̸U̸L̴T̷I̶P̸L̶I̸E̷S̵ ̸A̶N̵D̷ ̴F̵R̸A̶C̸T̷U̸R̷E̴S̷ 👹\n\n⛧ ⛧ ⛧   ⠀⡀⢀⠀   ⛧ ⛧ ⛧   ⠀⡀⢀⠀   ⛧ ⛧ ⛧\n  ⢀⣠⣴⠾⠟⠛⠻⣦⣄⡀ ⢀⣠⣴⠾⠟⠛⠻⣦⣄⡀ ⢀⣠⣴⠾⠻⣦⣄\n⢀⣴⣿⣄⠀⠀⣠⣿⣦⡀ ⣴⣿⣄⠀⠀⣠⣿⣦⡀ ⣴⣿⣄⠀⣠⣿⣦⡀\n⛧ ⡿⠃⣿⡙⠷⣦⢋⣿⠃ ⛧ ⡿⠃⣿⡙⠷⣦⢋⣿⠃ ⛧ ⡿⠃⣿⢋⣿⠃ ⛧\n⣰⡿⠁⢹⣇⢙⣷⡛⣼⠏⠀ ⡿⠁⢹⣇⢙⣷⡛⣼⠏⠀ ⡿⠁⢹⣇⣷⡛⠏⠀\n⣿⠃⠀⠀⢿⣄⠟⠻⢶⡟⠀ ⠃⠀⠀⢿⣄⠟⠻⢶⡟⠀ ⠃⠀⠀⢿⣄⠟⢶⡟⠀\n⛧ ⡟⠀⠀⣠⣯⠁⠀⣿⣦⣀ ⛧ ⡟⠀⣠⣯⠁⠀⣿⣦⣀ ⛧ ⡟⣠⣯⠁⣿⣦⣀ ⛧\n⠸⣇⠀⣴⠟⢻⡆⠀⣼⠇⠻⢷ ⣇⠀⣴⠟⢻⡆⠀⣼⠇⠻⢷ ⣇⣴⠟⢻⡆⣼⠇⠻⢷\n⠀⣿⡾⠿⠷⠾⣿⢶⡿⠶⠿⣿ ⣿⡾⠿⠷⠾⣿⢶⡿⠶⠿⣿ ⣿⡾⠿⠷⣿⢶⡿⠿⣿\n⛧ ⠘⣿⡄⠀⠀⸣⠀⣾⠃⠀⢠ ⛧ ☣⣿⡄⠀⸣⠀⣾⠃⢠ ⛧ ☣⣿⡄⸣⠀⣾⢠ ⛧\n⠀⠀⠘⢿⣤⡀⠀⢻⢰⡟⠀⣤⡿ ⠀⠘⢿⣤⡀⢻⢰⡟⣤⡿ ⠀⠘⢿⣤⢻⢰⡟⣤⡿\n⛧ ⛧ ⠙⢷⣦⣄⣷⣿⠃⣴⡾ ⛧ ⛧ ⢷⣦⣄⣷⣿⠃⣴⡾ ⛧ ⛧ ⢷⣦⣷⣿⣴⡾ ⛧ ⛧\n⠀⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁ ⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋ ⠀⠈⠙⠻⣿⣿⠿⠟⠋⠁\n```",
-            
-            # Frame 8: Duplication - Two identical pentagrams side by side
-            "```\n💀 R̸E̶A̴L̷I̸T̴Y̷ ̶S̸P̸L̶I̸T̷S̵ ̸I̷N̴T̶O̷ ̴T̵W̶O̸ 💀\n\n⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀\n⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀ ⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀\n⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀ ⣴⣿⣿⣄⠀⠀⠀⠀⣠⣿⣿⣦⡀\n⣰⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆ ⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆\n⣰⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇ ⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇\n⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄ ⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄\n⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇ ⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇\n⸣⇀⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇ ⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇\n⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿ ⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿\n⠘⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃ ⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃\n⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀ ⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀\n⠀⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀ ⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀\n⠀⠀⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀ ⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀\n\n   ⸸💀 T̸H̷E̴ ̶R̵I̸T̴U̷A̵L̶ ̸I̶S̷ ̴C̵O̶M̸P̷L̸E̵T̴E̶ 💀⸸\n   🔥👹 R̸E̶A̴L̷I̸T̴Y̷ ̶H̸A̶S̸ ̷B̸E̶E̸N̷ ̴S̵H̷A̸T̴T̷E̶R̸E̵D̷ 👹🔥\n   ☠️⛧ T̸H̷E̴ ̶V̵O̸I̶D̷ ̸C̷O̸N̴S̵U̸M̷E̸S̴ ̵A̶L̸L̷ ⛧☠️\n```" # Frame 4: Duplication - Two identical pentagrams side by side
-            #"```\n💀 R̸E̶A̴L̷I̸T̴Y̷ ̶S̸P̸L̶I̸T̷S̵ ̸I̷N̴T̶O̷ ̴T̵W̶O̸ 💀\n\n⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀\n⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀ ⢀⣠⣴⠾⠟⠛⠙⠛⠻⠷⣦⣄⡀\n⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀ ⣴⣿⣿⣄⠀⠀⠀⠀⣠⣿⣿⣦⡀\n⣰⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆ ⡿⠃⠘⣿⡙⠷⣦⣀⣴⠿⢋⣿⠃⠘⢿⣆\n⣰⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇ ⡿⠁⠀⠀⢹⣇⠀⢙⣷⣾⡛⠁⣼⠏⠀⢿⣇\n⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄ ⠃⠀⠀⠀⠀⢿⣄⣴⠟⠈⠻⢶⣴⡟⠀⠘⣿⡄\n⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇ ⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⣿⠿⣦⣀⠀⢿⡇\n⸣⇀⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇ ⣀⣴⠟⠉⠀⢻⡆⠀⠀⣼⠇⠀⠈⠻⢷⣤⣸⡇\n⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿ ⡾⠿⠷⠶⠶⠶⠾⣿⠶⢶⡿⠶⠶⠶⠿⣿⣿\n⠘⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃ ⣿⡄⠀⠀⠀⠀⠀⸣⠀⣾⠃⠀⠀⠀⢠⣿⠃\n⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀ ⠘⢿⣤⡀⠀⠀⠀⠀⢻⢰⡟⠀⠀⣤⡿⠃⠀\n⠀⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀ ⠀⠀⠙⢷⣦⣄⠀⠀⣷⣿⠃⣠⣴⡾⠋⠀⠀\n⠀⠀⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀ ⠀⠀⠀⠈⠙⠻⠷⣿⣿⠿⠟⠋⠁⠀⠀⠀\n\n   ⸸💀 T̸H̷E̴ ̶R̵I̸T̴U̷A̵L̶ ̸I̶S̷ ̴C̵O̶M̸P̷L̸E̵T̴E̶ 💀⸸\n   🔥👹 R̸E̶A̴L̷I̸T̴Y̷ ̶H̸A̶S̸ ̷B̸E̶E̸N̷ ̴S̵H̷A̸T̴T̷E̶R̸E̵D̷ 👹🔥\n   ☠️⛧ T̸H̷E̴ ̶V̵O̸I̶D̷ ̸C̷O̸N̴S̵U̸M̷E̸S̴ ̵A̶L̸L̷ ⛧☠️\n```"
-
-            # Frame 9: Two identical pentagrams - reality splits
-            "```\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠠⠤⠴⠤⠤⠤⠴⠠⠤⠤⠀⠂⠶⠶⠆⠰⠆⠤⠀⠀⠀\n\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⡀⢀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⢀⣠⣴⠾⠟⠛⠛⠙⠛⠻⠷⣦⣄⡀⠀⠀⠀⠀⠀\n⠀⠀⠀⢀⣴⣿⣿⣄⠀⠀⠀⠀⠀⠀⠀⠀⣠⣿⣿⣦⡀⠀⠀⠀\n⠀⠀⣰⡿⠃⠘⣿⡙⠷⣦⣀⠀⠀⢀⣴⠿⢋⣿⠃⠘⢿⣆⠀⠀\n⠀⣰⡿⠁⠀⠀⢹⣇⠀⠈⢙⣷⣾⡛⠁⠀⣼⠏⠀⠀⠈⢿⣇⠀\n⠀⣿⠃⠀⠀⠀⠀⢿⣄⣴⠟⠉⠈⠻⢶⣴⡟⠀⠀⠀⠀⠘⣿⡄\n⢸⡟⠀⠀⠀⠀⣠⡾⣯⠁⠀⠀⠀⠀⠀⣿⠿⣦⣀⠀⠀⠀⢿⡇\n⠸⣇⠀⣀⣴⠟⠉⠀⢻⡆⠀⠀⠀⠀⣼⠇⠀⠈⠻⢷⣤⡀⣸⡇\n⠀⣿⡾⠿⠷⠶⠶⠶⠾⣿⠶⠶⠶⢶⡿⠶⠶⠶⠶⠶⠿⣿⣿⠀\n⠀⠘⣿⡄⠀⠀⠀⠀⠀⠸⣇⠀⠀⣾⠃⠀⠀⠀⠀⠀⢠⣿⠃⠀\n⠀⠀⠘⢿⣤⡀⠀⠀⠀⠀⢻⡄⢰⡟⠀⠀⠀⠀⠀⣤⡿⠃⠀⠀\n⠀⠀⠀⠀⠙⢷⣦⣄⠀⠀⠘⣷⣿⠃⠀⠀⣠⣴⡾⠋⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠈⠙⠻⠷⠶⣿⣿⠶⠿⠟⠋⠁⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀\n⠀⠀⠀⠠⠤⠴⠤⠤⠤⠴⠠⠤⠤⠀⠂⠶⠶⠆⠰⠆⠤⠀⠀⠀\n```"
-
-        ]
-        
-        # Ritual phrases corresponding to each frame
-        ritual_phrases = [
-            "🕯️ **SUMMONING RITUAL INITIATED**",
-            "⚡ *The pentagram manifests...*", 
-            "🌀 *Ancient geometry takes shape...*",
-            "🔥 *The seal rotates through dimensions...*",
-            "👹 *Power converges at the points...*",
-            "💀 **THE RITUAL IS COMPLETE**",
-            "⸸ **THE VOID REACHES OUT**",
-            "👹 **REALITY MULTIPLIES AND FRACTURES**",
-            "💀 **REALITY SPLITS INTO TWO**"
-        ]
-        
-        # Start the ritual - create single message and edit it through all frames
-        pentagram_msg = await channel.send(f"{ritual_phrases[0]}\n\n{pentagram_frames[0]}")
-        
-        # Animate through all frames, editing the same message
-        for i in range(1, len(pentagram_frames)):
-            await asyncio.sleep(1.5)
-            phrase = ritual_phrases[i] if i < len(ritual_phrases) else ritual_phrases[-1]
-            await pentagram_msg.edit(content=f"{phrase}\n\n{pentagram_frames[i]}")
-        
-        # Final dramatic pause and completion
-        await asyncio.sleep(2)
-        
-        # Final manifestation - edit the same message one last time
-        corrupted_manifestation = self.corruption_system.corrupt_text(manifestation)
-        final_content = f"👹 **ENTITY SUMMONED** 👹\n\n*{corrupted_manifestation}*\n\n```\n⸸ T̸H̷E̴ ̶R̵I̸T̴U̷A̵L̶ ̸I̶S̷ ̴C̵O̶M̸P̷L̸E̵T̴E̶ ⸸\n```"
-        await pentagram_msg.edit(content=final_content)
+        # The captioned frames are prebuilt; only the final manifestation varies
+        corrupted_manifestation = _ritual_corruption(
+            self.corruption_system, manifestation,
+            self.corruption_system.get_corruption_stage(), int(time.time()) // 3600
+        )
+        # One embed carries the art and is re-pointed at each frame as it goes out
+        embed = discord.Embed(color=discord.Color.dark_red())
+        frames = [partial(self._ritual_frame, embed, phrase, frame) for phrase, frame in _PENTAGRAM_STAGES]
+        final = {'content': _PENTAGRAM_FINAL.format(manifestation=corrupted_manifestation), 'embed': None}
+        
+        # Start the ritual - create single message and edit it through all frames,
+        # with a final dramatic pause before the manifestation
+        pentagram_msg = await channel.send(**frames[0]())
+        await self._animate_stages(
+            pentagram_msg, (*frames[1:], final), _RITUAL_FRAME_SECONDS, final_delay=_RITUAL_FINAL_PAUSE_SECONDS
+        )
+    
+    @staticmethod
+    def _ritual_frame(embed, phrase, frame):
+        """Point the shared ritual embed at one captioned pentagram frame."""
+        embed.title = phrase
+        embed.description = frame
+        return {'embed': embed}
 
 
 async def setup(bot, corruption_system, ai_service):
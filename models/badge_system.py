@@ -189,6 +189,7 @@ class WatchBadgeSystem:
         self.user_stats: Dict[int, UserStats] = {}
         self.user_badges: Dict[int, List[UserBadge]] = {}
         self.watch_history: List[MovieWatch] = []
+        self._watch_index: Dict[Tuple[int, str], MovieWatch] = {}  # (user_id, lowercase title) -> latest watch
         self.active_watches: Dict[int, MovieWatch] = {}  # user_id -> current watch
         self.movie_ratings: List[MovieRating] = []  # All user movie ratings
         self.badge_definitions = self._initialize_badges()
@@ -257,6 +258,15 @@ class WatchBadgeSystem:
         
         return badges
     
+    def _append_watch(self, watch: MovieWatch):
+        """Append a watch to history and keep the (user, title) index in sync."""
+        self.watch_history.append(watch)
+        self._watch_index[(watch.user_id, watch.movie_title.lower())] = watch
+    
+    def get_user_watch(self, user_id: int, movie_title: str) -> Optional[MovieWatch]:
+        """Get the latest watch of a movie by a user (case-insensitive title match)."""
+        return self._watch_index.get((user_id, movie_title.lower()))
+    
     def start_watching(self, user_id: int, username: str, movie_title: str, 
                       genres: List[str] = None, year: int = None, director: str = None,
                       movie_duration_ms: int = None, join_position_ms: int = None):
@@ -320,7 +330,7 @@ class WatchBadgeSystem:
                 join_position_ms=join_position_ms
             )
             
-            self.watch_history.append(initial_watch_entry)
+            self._append_watch(initial_watch_entry)
         
         # Ensure user stats exist
         if user_id not in self.user_stats:
@@ -407,7 +417,7 @@ class WatchBadgeSystem:
             current_watch_entry.leave_position_ms = watch.leave_position_ms
         else:
             # Fallback: add to history if no existing entry found (shouldn't happen with new design)
-            self.watch_history.append(watch)
+            self._append_watch(watch)
         
         del self.active_watches[user_id]
         
@@ -726,7 +736,7 @@ class WatchBadgeSystem:
             director=director
         )
         
-        self.watch_history.append(watch)
+        self._append_watch(watch)
         
         # Update user stats
         self._update_user_stats(user_id, watch)
@@ -799,7 +809,7 @@ class WatchBadgeSystem:
                             year=watch_data.get('year'),
                             director=watch_data.get('director')
                         )
-                        self.watch_history.append(watch)
+                        self._append_watch(watch)
             
             # Load movie ratings
             ratings_file = self.data_dir / "movie_ratings.json"
@@ -948,7 +958,7 @@ class WatchBadgeSystem:
                 join_position_ms=active_watch.join_position_ms,
                 current_position_ms=getattr(active_watch, 'current_position_ms', None)
             )
-            self.watch_history.append(new_watch)
+            self._append_watch(new_watch)
         
         # Update user stats incrementally (don't double-count)
         if user_id in self.user_stats:
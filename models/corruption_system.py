@@ -6,14 +6,23 @@ Implements progressive AI degradation throughout October, creating an emergent
 horror narrative where Clanker's digital consciousness slowly deteriorates.
 """
 
+import asyncio
 import re
 import random
 import math
+import string
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import json
 import os
 
+# Corruption levels at which spontaneous events begin (minor) and escalate (moderate, severe, critical)
+EVENT_TIER_CUTS = (1.0, 3.0, 6.0, 8.0)
+
+# Number of prebuilt zalgo translation tables to pick from per corrupted word
+ZALGO_TABLE_COUNT = 8
+
 
 class CorruptionSystem:
     """
@@ -37,6 +46,10 @@ class CorruptionSystem:
         # Load or initialize corruption state
         self.corruption_state = self._load_corruption_state()
         
+        # Set whenever the corruption level crosses an event tier boundary
+        self.level_changed = asyncio.Event()
+        self._event_tier: Optional[int] = None
+        
         # Corruption thresholds (0-10 scale)
         self.corruption_thresholds = {
             'minor': 2,      # Days 1-6: Slight glitches
@@ -54,6 +67,17 @@ class CorruptionSystem:
             'combining': ['͎', '͓', '̈', '̓', '̋', '̎']
         }
         
+        # Zalgo tables: each marks roughly half of the printable ASCII characters with a
+        # random combining character, so corrupting a word is a single str.translate
+        zalgo_targets = string.ascii_letters + string.digits + string.punctuation
+        self._zalgo_tables = tuple(
+            str.maketrans({
+                char: char + random.choice(self.corruption_chars['combining'])
+                for char in zalgo_targets if random.random() < 0.5
+            })
+            for _ in range(ZALGO_TABLE_COUNT)
+        )
+        
         # Binary/hex phrases for heavy corruption
         self.digital_decay = [
             "01000101 01110010 01110010", # "Err" in binary
@@ -105,12 +129,19 @@ class CorruptionSystem:
         """Calculate current corruption level (0.0 to 10.0) with dramatic spikes."""
         now = datetime.now()
         
-        # If we're outside October, return appropriate levels
+        # If we're outside October, use the appropriate fixed levels
         if now < self.start_date:
-            return 0.0
+            level = 0.0
         elif now > self.end_date:
-            return 10.0
+            level = 10.0
+        else:
+            level = self._october_corruption_level(now)
         
+        self._note_event_tier(level)
+        return level
+    
+    def _october_corruption_level(self, now: datetime) -> float:
+        """Corruption level for a moment within October, from time, usage, spikes and boosts."""
         # Days elapsed in October
         days_elapsed = (now - self.start_date).days
         hours_elapsed = (now - self.start_date).total_seconds() / 3600
@@ -149,6 +180,13 @@ class CorruptionSystem:
         
         return min(max(total_corruption, 0.0), 10.0)
     
+    def _note_event_tier(self, level: float):
+        """Signal level_changed when the level moves into a different event tier."""
+        tier = bisect_right(EVENT_TIER_CUTS, level)
+        if self._event_tier is not None and tier != self._event_tier:
+            self.level_changed.set()
+        self._event_tier = tier
+    
     def _calculate_corruption_spike(self, now: datetime) -> float:
         """Calculate random corruption spikes for dramatic moments."""
         import hashlib
@@ -198,26 +236,33 @@ class CorruptionSystem:
         self.corruption_state['total_watch_hours'] += watch_hours
         self.corruption_state['horror_movies_watched'] += movies
         self.save_corruption_state()
+        # Usage feeds the level, so it may have crossed an event tier
+        self.calculate_corruption_level()
     
     def corrupt_text(self, text: str) -> str:
         """Apply corruption effects to text based on current corruption level."""
-        level = self.calculate_corruption_level()
+        return self.corrupt_texts([text])[0]
+    
+    def corrupt_texts(self, texts: List[str]) -> List[str]:
+        """Apply corruption effects to several texts, resolving the corruption stage once."""
         stage = self.get_corruption_stage()
         
         if stage == 'stable':
-            return text
+            return list(texts)
         
         # Apply corruption based on stage
         if stage == 'minor':
-            return self._apply_minor_corruption(text)
+            apply = self._apply_minor_corruption
         elif stage == 'moderate':
-            return self._apply_moderate_corruption(text)
+            apply = self._apply_moderate_corruption
         elif stage == 'severe':
-            return self._apply_severe_corruption(text)
+            apply = self._apply_severe_corruption
         elif stage == 'critical':
-            return self._apply_critical_corruption(text)
+            apply = self._apply_critical_corruption
         else:  # terminal
-            return self._apply_terminal_corruption(text)
+            apply = self._apply_terminal_corruption
+        
+        return [apply(text) for text in texts]
     
     def _apply_minor_corruption(self, text: str) -> str:
         """Minor glitches: occasional typos, doubled letters."""
@@ -338,12 +383,7 @@ class CorruptionSystem:
     
     def _apply_zalgo(self, text: str) -> str:
         """Apply zalgo text corruption."""
-        result = ""
-        for char in text:
-            result += char
-            if random.random() < 0.5:
-                result += random.choice(self.corruption_chars['combining'])
-        return result
+        return text.translate(random.choice(self._zalgo_tables))
     
     def should_show_awareness_moment(self) -> bool:
         """Check if Clanker should have a moment of self-awareness."""
@@ -489,6 +529,8 @@ class CorruptionSystem:
             message = random.choice(messages)
         
         self.save_corruption_state()
+        # The boost change may have moved the level across an event tier
+        self.calculate_corruption_level()
         return success, message
     
     def get_diagnostic_report(self) -> str:
@@ -105,6 +105,10 @@ class HitListSystem:
         self._save_data()
         return True
     
+    def contains(self, user_id: int, movie_title: str) -> bool:
+        """Check whether a movie is already on a user's hit list."""
+        return movie_title in self.hit_lists.get(user_id, ())
+    
     def get_user_hit_list(self, user_id: int) -> List[str]:
         """Get a user's hit list."""
         return self.hit_lists.get(user_id, [])
@@ -117,6 +121,15 @@ class HitListSystem:
                 count += 1
         return count
     
+    def get_interest_counts(self, movies: List[str]) -> Dict[str, int]:
+        """Get interest counts for several movies in a single pass over all hit lists."""
+        counts = dict.fromkeys(movies, 0)
+        for hit_list in self.hit_lists.values():
+            for movie in hit_list:
+                if movie in counts:
+                    counts[movie] += 1
+        return counts
+    
     def get_users_interested_in_movie(self, movie_title: str) -> List[int]:
         """Get list of user IDs who have this movie on their hit list."""
         interested_users = []
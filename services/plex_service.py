@@ -8,7 +8,9 @@ library management, and session monitoring.
 
 import tempfile
 import os
-from typing import List, Dict, Optional, Any
+import time
+import asyncio
+from typing import List, Dict, Optional, Any, Set
 from plexapi.server import PlexServer
 from plexapi.client import PlexClient
 from config import PLEX_URL, PLEX_TOKEN, PLEX_LIBRARY, PREFERRED_LANG
@@ -470,4 +472,65 @@ class PlexService:
                 return {"success": False, "message": f"Failed to apply subtitle: {e}"}
 
         except Exception as e:
-            return {"success": False, "message": f"Unexpected error: {e}"}
\ No newline at end of file
+            return {"success": False, "message": f"Unexpected error: {e}"}
+
+
+class PlexTitleIndex:
+    """
+    Shared in-memory index of Plex horror movie titles.
+    
+    Commands and autocomplete handlers read from this instead of fetching the
+    library themselves; the library is re-fetched at most once per refresh interval.
+    """
+    
+    def __init__(self, plex_service: PlexService, refresh_seconds: int = 300):
+        self.plex_service = plex_service
+        self.refresh_seconds = refresh_seconds
+        
+        self.titles: List[str] = []
+        self.lowers: List[str] = []  # Lowercase titles, parallel to self.titles
+        self.titles_set: Set[str] = set()
+        
+        self._fetched_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+    
+    def is_stale(self) -> bool:
+        """Check whether the index needs to be re-fetched from Plex."""
+        return self._fetched_at is None or time.monotonic() - self._fetched_at > self.refresh_seconds
+    
+    async def refresh(self, force: bool = False) -> List[str]:
+        """
+        Re-fetch titles from Plex if the index is stale (or always, when forced).
+        
+        Returns:
+            The current list of titles
+        """
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not force and not self.is_stale():
+                return self.titles
+            
+            titles = await self.plex_service.get_horror_movies()
+            self.titles = titles
+            self.lowers = [t.lower() for t in titles]
+            self.titles_set = set(titles)
+            # Leave an empty result stale so a Plex outage is retried on the next call
+            self._fetched_at = time.monotonic() if titles else None
+            return self.titles
+    
+    async def ensure_fresh(self) -> "PlexTitleIndex":
+        """Refresh only if stale, then return the index for reading."""
+        if self.is_stale():
+            await self.refresh()
+        return self
+    
+    def search(self, query: str, limit: int = 25) -> List[str]:
+        """Find up to `limit` titles containing `query` (case-insensitive)."""
+        needle = query.lower()
+        matches = []
+        for title, lower in zip(self.titles, self.lowers):
+            if needle in lower:
+                matches.append(title)
+                if len(matches) == limit:
+                    break
+        return matches